@@ -9,13 +9,13 @@ import sys
 # Hugging Face Spaces automatically provides secrets as environment variables
 # No need to load from .env file
 
-# Set defaults for Hugging Face Spaces
-if 'APP_HOST' not in os.environ:
-    os.environ['APP_HOST'] = '0.0.0.0'
-if 'APP_PORT' not in os.environ:
-    os.environ['APP_PORT'] = '7860'
-if 'OPENAI_MODEL' not in os.environ:
-    os.environ['OPENAI_MODEL'] = 'gpt-4o-mini'
+# Set defaults for Hugging Face Spaces (existing values are left untouched)
+for _key, _value in {
+    'APP_HOST': '0.0.0.0',
+    'APP_PORT': '7860',
+    'OPENAI_MODEL': 'gpt-4o-mini',
+}.items():
+    os.environ.setdefault(_key, _value)
 
 # Install mock kumoai for demo mode if real SDK not available
 sys.path.insert(0, os.path.dirname(__file__))
@@ -23,9 +23,10 @@ try:
     import kumoai
 except ImportError:
     import mock_kumoai
-    sys.modules['kumoai'] = mock_kumoai
-    sys.modules['kumoai.experimental'] = mock_kumoai
-    sys.modules['kumoai.experimental.rfm'] = mock_kumoai
+    mock_kumoai.install()
 
-# Now run the main application
-exec(open('main_with_upload.py').read())
+# Now run the main application (imported so the cached bytecode is reused)
+import main_with_upload
+
+if __name__ == "__main__":
+    main_with_upload.main()
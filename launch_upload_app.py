@@ -11,9 +11,10 @@ os.environ['APP_PORT'] = '7862'
 # Install mock kumoai
 sys.path.insert(0, '/home/ubuntu/insurance-claims-kumo-agent')
 import mock_kumoai
-sys.modules['kumoai'] = mock_kumoai
-sys.modules['kumoai.experimental'] = mock_kumoai
-sys.modules['kumoai.experimental.rfm'] = mock_kumoai
+mock_kumoai.install()
 
 # Now run the application
-exec(open('main_with_upload.py').read())
+import main_with_upload
+
+if __name__ == "__main__":
+    main_with_upload.main()
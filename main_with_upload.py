@@ -4,76 +4,17 @@ KumoRFM Insurance Claims AI Agent - Main Application with Upload Feature
 Entry point for the FraudAGENT application with Excel upload capability.
 """
 
+import io
 import os
 import sys
-from pathlib import Path
-from dotenv import load_dotenv
+import threading
 
 # Add src to path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "src"))
 
-from src.data_loader import InsuranceDataLoader
-from src.kumo_setup import KumoSetup
-from src.text_to_pql import TextToPQLTranslator
-from src.kumo_agent import KumoConversationAgent
-from src.upload_ui import DataUploadUI
-import gradio as gr
-
-
-def validate_environment() -> bool:
-    """
-    Validate required environment variables and dependencies.
-    
-    Returns:
-        True if validation passes, False otherwise
-    """
-    print("\n" + "="*80)
-    print("ENVIRONMENT VALIDATION")
-    print("="*80)
-    
-    errors = []
-    warnings = []
-    
-    # Check API keys
-    if not os.getenv("KUMO_API_KEY"):
-        errors.append("KUMO_API_KEY environment variable not set")
-    else:
-        print("✓ KUMO_API_KEY is set")
-    
-    if not os.getenv("OPENAI_API_KEY"):
-        errors.append("OPENAI_API_KEY environment variable not set")
-    else:
-        print("✓ OPENAI_API_KEY is set")
-    
-    # Check data path - now optional since users can upload
-    data_path = os.getenv("INSURANCE_DATA_PATH", "data/insurance_claims_data.parquet")
-    if not os.path.exists(data_path) and not os.path.exists("uploaded_data"):
-        warnings.append(f"No data found at {data_path} or uploaded_data/")
-        warnings.append("Please upload data using the Data Upload tab")
-        print(f"⚠ No data found - upload required")
-    else:
-        if os.path.exists(data_path):
-            print(f"✓ Default data file found: {data_path}")
-        if os.path.exists("uploaded_data"):
-            print(f"✓ Uploaded data found: uploaded_data/")
-    
-    # Print errors
-    if errors:
-        print("\n❌ VALIDATION FAILED:")
-        for error in errors:
-            print(f"  • {error}")
-        print("\nPlease check your .env file and ensure all required variables are set.")
-        print("See .env.template for reference.")
-        return False
-    
-    # Print warnings
-    if warnings:
-        print("\n⚠️  WARNINGS:")
-        for warning in warnings:
-            print(f"  • {warning}")
-    
-    print("\n✅ Environment validation passed!")
-    return True
+# Only lightweight helpers at module level; gradio and the phase modules are
+# imported in main() once the environment has been validated.
+from src.pipeline import Config, configure_logging, validate_environment, has_uploaded_data, bootstrap_agent, print_phase, flush_log
 
 
 def determine_data_source() -> str:
@@ -84,7 +25,7 @@ def determine_data_source() -> str:
         Path to data directory
     """
     # Priority: uploaded_data > INSURANCE_DATA_PATH > data/
-    if os.path.exists("uploaded_data") and len(os.listdir("uploaded_data")) > 0:
+    if has_uploaded_data():
         print("\n📊 Using uploaded data as primary source: uploaded_data/")
         return "uploaded_data"
     
@@ -97,18 +38,75 @@ def determine_data_source() -> str:
     return None
 
 
-def create_integrated_interface(agent, graph_schema, upload_ui):
+AGENT_LOADING_MESSAGE = (
+    "⏳ The agent is still initializing (loading data and KumoRFM). "
+    "Please try again in a moment."
+)
+
+
+class AgentBoot:
+    """
+    Runs Phases 1-4 in a background thread so the Gradio server can start
+    serving the UI while the data, KumoRFM and translator are initialized.
+    """
+    
+    def __init__(self, cfg: Config):
+        """
+        Initialize the boot runner.
+        
+        Args:
+            cfg: Application configuration
+        """
+        self.cfg = cfg
+        self.agent = None
+        self.graph_schema = None
+        self.error = None
+        self.ready = threading.Event()
+        self._thread = threading.Thread(target=self._boot, name="agent-boot", daemon=True)
+    
+    def start(self) -> "AgentBoot":
+        """Start Phases 1-4 in the background."""
+        self._thread.start()
+        return self
+    
+    def _boot(self):
+        try:
+            self.agent, self.graph_schema = bootstrap_agent(
+                self.cfg.data_path,
+                openai_model=self.cfg.openai_model
+            )
+        except Exception as e:
+            self.error = e
+        finally:
+            # Set even on failure so waiting handlers are released
+            self.ready.set()
+    
+    def join(self):
+        """Wait for Phases 1-4 to finish and re-raise any boot error."""
+        self.ready.wait()
+        self._thread.join()
+        if self.error is not None:
+            raise self.error
+
+
+def create_integrated_interface(boot: AgentBoot, upload_ui, cfg: Config):
     """
     Create integrated Gradio interface with upload tab.
     
+    The interface is built before the agent is ready; until the boot has
+    finished the chat handler reports a loading error and the query
+    handlers return no results.
+    
     Args:
-        agent: KumoConversationAgent instance
-        graph_schema: Graph schema dictionary
+        boot: AgentBoot running Phases 1-4
         upload_ui: DataUploadUI instance
+        cfg: Application configuration
         
     Returns:
         Gradio Blocks interface
     """
+    import gradio as gr
+    
     with gr.Blocks(
         title="FraudAGENT - Insurance Claims AI Agent",
         theme=gr.themes.Soft()
@@ -124,6 +122,16 @@ def create_integrated_interface(agent, graph_schema, upload_ui):
             upload_ui.create_upload_tab()
             
             # Chat Agent Tab
+            def chat_response(message, history):
+                history = history or []
+                if not boot.ready.is_set() or boot.agent is None:
+                    # Raised rather than returned, so the loading message
+                    # is never recorded as a chat response
+                    raise gr.Error(AGENT_LOADING_MESSAGE)
+                response = boot.agent.process_query(message)
+                history.append((message, response['response']))
+                return history, response.get('pql_query', '')
+            
             with gr.Tab("💬 Chat Agent"):
                 gr.Markdown("""
                 Ask questions in natural language about insurance claims, fraud detection, and predictions.
@@ -174,16 +182,10 @@ def create_integrated_interface(agent, graph_schema, upload_ui):
                         )
                 
                 # Event handlers
-                def chat_response(message, history):
-                    response = agent.process_query(message)
-                    history = history or []
-                    history.append((message, response['response']))
-                    return history, response.get('pql_query', '')
-                
                 def execute_query(pql):
-                    if not pql:
+                    if not pql or not boot.ready.is_set() or boot.agent is None:
                         return None
-                    result = agent.execute_pql_query(pql)
+                    result = boot.agent.execute_pql_query(pql)
                     return result.get('dataframe')
                 
                 submit_btn.click(
@@ -210,16 +212,23 @@ def create_integrated_interface(agent, graph_schema, upload_ui):
             with gr.Tab("📊 Data Explorer"):
                 gr.Markdown("### Graph Schema")
                 
-                if graph_schema:
-                    schema_md = "## Tables\n\n"
-                    for table_name, table_info in graph_schema.get('tables', {}).items():
-                        schema_md += f"### `{table_name}`\n"
-                        schema_md += f"- **Primary Key:** `{table_info.get('primary_key', 'N/A')}`\n"
-                        schema_md += f"- **Columns:** {len(table_info.get('columns', {}))}\n\n"
+                def render_schema():
+                    # Rendered on page load, once the graph has been materialized
+                    boot.ready.wait()
+                    graph_schema = boot.graph_schema
+                    if not graph_schema:
+                        return "⚠️ No schema available. Please upload data first."
                     
-                    gr.Markdown(schema_md)
-                else:
-                    gr.Markdown("⚠️ No schema available. Please upload data first.")
+                    parts = ["## Tables\n\n"]
+                    for table_name, table_info in graph_schema.get('tables', {}).items():
+                        parts.append(
+                            f"### `{table_name}`\n"
+                            f"- **Primary Key:** `{table_info.get('primary_key', 'N/A')}`\n"
+                            f"- **Columns:** {len(table_info.get('columns', {}))}\n\n"
+                        )
+                    return "".join(parts)
+                
+                schema_view = gr.Markdown(AGENT_LOADING_MESSAGE)
             
             # Direct PQL Query Tab
             with gr.Tab("⚡ Direct PQL Query"):
@@ -256,9 +265,11 @@ def create_integrated_interface(agent, graph_schema, upload_ui):
                 
                 **KumoRFM Status:** Connected
                 """.format(
-                    determine_data_source() or "No data loaded",
-                    os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+                    cfg.data_path or "No data loaded",
+                    cfg.openai_model
                 ))
+        
+        app.load(fn=render_schema, outputs=schema_view)
     
     return app
 
@@ -267,115 +278,65 @@ def main():
     """
     Main application entry point.
     """
-    print("="*80)
-    print("🏥 KUMORFM INSURANCE CLAIMS AI AGENT - FRAUDAGENT (WITH UPLOAD)")
-    print("="*80)
-    print("Fraud detection and predictive analytics using KumoRFM and OpenAI")
-    print("="*80)
+    log = io.StringIO()
+    print("="*80, file=log)
+    print("🏥 KUMORFM INSURANCE CLAIMS AI AGENT - FRAUDAGENT (WITH UPLOAD)", file=log)
+    print("="*80, file=log)
+    print("Fraud detection and predictive analytics using KumoRFM and OpenAI", file=log)
+    print("="*80, file=log)
+    flush_log(log)
     
     # Load environment variables
-    env_file = Path(__file__).parent / ".env"
-    if env_file.exists():
+    env_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".env")
+    if os.path.isfile(env_file):
+        from dotenv import load_dotenv
         load_dotenv(env_file)
         print(f"✓ Loaded environment from: {env_file}")
     else:
         print(f"⚠ No .env file found at: {env_file}")
         print("  Using system environment variables")
+    configure_logging()
     
     # Validate environment
-    if not validate_environment():
-        print("\n❌ Application startup failed due to environment validation errors.")
-        print("\nQuick fix:")
-        print("  1. Copy .env.template to .env")
-        print("  2. Edit .env and add your API keys")
-        print("  3. Run the application again")
+    if not validate_environment(allow_upload=True):
+        log = io.StringIO()
+        print("\n❌ Application startup failed due to environment validation errors.", file=log)
+        print("\nQuick fix:", file=log)
+        print("  1. Copy .env.template to .env", file=log)
+        print("  2. Edit .env and add your API keys", file=log)
+        print("  3. Run the application again", file=log)
+        flush_log(log)
         sys.exit(1)
     
-    # Get configuration
-    app_host = os.getenv("APP_HOST", "0.0.0.0")
-    app_port = int(os.getenv("APP_PORT", "7860"))
-    share_ui = os.getenv("GRADIO_SHARE", "false").lower() == "true"
+    # Heavy imports, deferred until validation has passed
+    import gradio as gr
+    from src.upload_ui import DataUploadUI
+    
+    # Get configuration (data_path is empty in upload-only mode)
+    cfg = Config.from_env(data_path=determine_data_source() or "")
     
     try:
-        # Determine data source
-        data_path = determine_data_source()
-        
-        if data_path:
-            # ===== PHASE 1: Load and Profile Data =====
-            print("\n" + "="*80)
-            print("PHASE 1: DATA LOADING AND PROFILING")
-            print("="*80)
-            
-            loader = InsuranceDataLoader(data_path)
-            tables = loader.load_data()
-            schema_info = loader.profile_data()
-            loader.validate_temporal_columns()
-            loader.check_duplicates()
-            
-            print("\n✅ Phase 1 complete: Data loaded and profiled")
-            
-            # ===== PHASE 2: Initialize KumoRFM =====
-            print("\n" + "="*80)
-            print("PHASE 2: KUMORFM INITIALIZATION")
-            print("="*80)
-            
-            kumo = KumoSetup()
-            kumo.authenticate()
-            
-            # Import dataset
-            local_tables = kumo.import_dataset(tables, auto_infer_metadata=True)
-            
-            # Create graph
-            graph = kumo.create_graph(local_tables, auto_infer_links=True)
-            
-            # Materialize graph
-            model = kumo.materialize_graph()
-            
-            # Get graph schema
-            graph_schema = kumo.get_graph_schema()
-            
-            print("\n✅ Phase 2 complete: KumoRFM initialized and graph materialized")
-            
-            # ===== PHASE 3: Initialize NL to PQL Translator =====
-            print("\n" + "="*80)
-            print("PHASE 3: NL TO PQL TRANSLATOR INITIALIZATION")
-            print("="*80)
-            
-            openai_model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
-            translator = TextToPQLTranslator(graph_schema, model=openai_model)
-            
-            print(f"\n✅ Phase 3 complete: Translator initialized with model {openai_model}")
-            
-            # ===== PHASE 4: Create Conversational Agent =====
-            print("\n" + "="*80)
-            print("PHASE 4: CONVERSATIONAL AGENT CREATION")
-            print("="*80)
-            
-            agent = KumoConversationAgent(kumo, translator, graph_schema)
-            
-            print("\n✅ Phase 4 complete: Conversational agent created")
+        if cfg.data_path:
+            # ===== PHASES 1-4: Data, KumoRFM, Translator, Agent =====
+            # Run in the background, overlapping with UI creation and launch
+            boot = AgentBoot(cfg).start()
         else:
             # No data yet - create minimal components
-            graph_schema = None
-            agent = None
+            boot = None
             print("\n⚠️  Starting in upload-only mode. Please upload data to enable predictions.")
         
         # ===== PHASE 5: Create Upload UI =====
-        print("\n" + "="*80)
-        print("PHASE 5: CREATING UPLOAD UI")
-        print("="*80)
+        print_phase("PHASE 5: CREATING UPLOAD UI")
         
         upload_ui = DataUploadUI()
         
         print("\n✅ Phase 5 complete: Upload UI created")
         
         # ===== PHASE 6: Launch Gradio Interface =====
-        print("\n" + "="*80)
-        print("PHASE 6: LAUNCHING GRADIO INTERFACE")
-        print("="*80)
+        print_phase("PHASE 6: LAUNCHING GRADIO INTERFACE")
         
-        if agent:
-            app = create_integrated_interface(agent, graph_schema, upload_ui)
+        if boot:
+            app = create_integrated_interface(boot, upload_ui, cfg)
         else:
             # Upload-only interface
             with gr.Blocks(title="FraudAGENT - Data Upload") as app:
@@ -388,26 +349,40 @@ def main():
                 3. The full interface will be available after restart
                 """)
         
-        print(f"\n🚀 Launching Gradio UI at http://{app_host}:{app_port}")
-        print(f"   Share mode: {'Enabled' if share_ui else 'Disabled'}")
-        print("\n" + "="*80)
-        print("APPLICATION READY!")
-        print("="*80)
-        print("\n💡 Features:")
-        print("  • Upload Excel files and convert to Parquet")
-        print("  • Ask questions in natural language")
-        print("  • Automatic PQL query generation")
-        print("  • Fraud detection and predictions")
-        print("\n" + "="*80)
+        print(f"\n🚀 Launching Gradio UI at http://{cfg.app_host}:{cfg.app_port}")
+        print(f"   Share mode: {'Enabled' if cfg.share_ui else 'Disabled'}")
         
-        # Launch Gradio
+        # Start serving without blocking; the agent keeps booting meanwhile
         app.launch(
-            server_name=app_host,
-            server_port=app_port,
-            share=share_ui,
-            show_error=True
+            server_name=cfg.app_host,
+            server_port=cfg.app_port,
+            share=cfg.share_ui,
+            show_error=True,
+            prevent_thread_lock=True
         )
         
+        if boot:
+            try:
+                boot.join()
+            except Exception:
+                app.close()
+                raise
+        
+        log = io.StringIO()
+        print("\n" + "="*80, file=log)
+        print("APPLICATION READY!", file=log)
+        print("="*80, file=log)
+        print("\n💡 Features:", file=log)
+        print("  • Upload Excel files and convert to Parquet", file=log)
+        print("  • Ask questions in natural language", file=log)
+        print("  • Automatic PQL query generation", file=log)
+        print("  • Fraud detection and predictions", file=log)
+        print("\n" + "="*80, file=log)
+        flush_log(log)
+        
+        # Keep serving until interrupted
+        app.block_thread()
+        
     except KeyboardInterrupt:
         print("\n\n⚠️  Application interrupted by user")
         sys.exit(0)
@@ -3,11 +3,15 @@ Mock KumoRFM Module for Demonstration
 Simulates KumoRFM SDK functionality without requiring actual API access.
 """
 
+import numpy as np
 import pandas as pd
-import random
 from typing import Dict, Any, Optional
 
 
+# Shared generator so each prediction is drawn with vectorized NumPy calls
+_rng = np.random.default_rng()
+
+
 class MockLocalTable:
     """Mock LocalTable class."""
     
@@ -17,28 +21,41 @@ class MockLocalTable:
         self.primary_key = primary_key
         self.time_column = time_column
         self.edges = []
+        self._cols = {}
         
     def infer_metadata(self):
         """Auto-infer metadata."""
-        # Infer primary key
+        # Infer primary key: first ID-like column whose values are unique
         for col in self.df.columns:
-            if 'id' in col.lower() and self.df[col].nunique() == len(self.df):
+            if 'id' not in col.lower():
+                continue
+            series = self.df[col]
+            # Long free-text values are not keys; a bounded head sample
+            # decides this before the whole column is hashed
+            if series.dtype == object and series.head(1000).str.len().max() > 64:
+                continue
+            if series.is_unique:
                 self.primary_key = col
                 print(f"Detected primary key '{col}' in table '{self.name}'")
                 break
         
-        # Infer time column
-        for col in self.df.columns:
-            if pd.api.types.is_datetime64_any_dtype(self.df[col]):
-                self.time_column = col
-                print(f"Detected time column '{col}' in table '{self.name}'")
-                break
+        # Infer time column from the dtypes, without touching column data
+        time_columns = [
+            col for col, dtype in self.df.dtypes.items()
+            if pd.api.types.is_datetime64_any_dtype(dtype)
+        ]
+        if time_columns:
+            self.time_column = time_columns[0]
+            print(f"Detected time column '{self.time_column}' in table '{self.name}'")
         
         return self
     
     def __getitem__(self, col_name):
-        """Get column object."""
-        return MockColumn(col_name)
+        """Get column object (one per column, so attribute writes persist)."""
+        col = self._cols.get(col_name)
+        if col is None:
+            col = self._cols[col_name] = MockColumn(col_name)
+        return col
     
     def print_metadata(self):
         """Print table metadata."""
@@ -91,68 +108,60 @@ class MockKumoRFM:
     def predict(self, query: str, anchor_time: Optional[pd.Timestamp] = None) -> pd.DataFrame:
         """Mock prediction - returns simulated results."""
         
-        # Parse query to determine result type
-        if "fraud_flag" in query.lower():
-            # Fraud prediction
-            if "FOR EACH" in query.upper():
-                # Multiple entities
-                num_results = 10
-                return pd.DataFrame({
-                    'ENTITY': range(1, num_results + 1),
-                    'ANCHOR_TIMESTAMP': [pd.Timestamp.now()] * num_results,
-                    'TARGET_PRED': [random.choice([True, False]) for _ in range(num_results)],
-                    'False_PROB': [random.uniform(0.3, 0.7) for _ in range(num_results)],
-                    'True_PROB': [random.uniform(0.3, 0.7) for _ in range(num_results)]
-                })
-            else:
-                # Single entity
-                return pd.DataFrame({
-                    'ENTITY': [1],
-                    'ANCHOR_TIMESTAMP': [pd.Timestamp.now()],
-                    'TARGET_PRED': [random.choice([True, False])],
-                    'False_PROB': [random.uniform(0.3, 0.7)],
-                    'True_PROB': [random.uniform(0.3, 0.7)]
-                })
+        # Parse query to determine result type (normalized once)
+        q_up = query.upper()
+        if "FRAUD_FLAG" in q_up:
+            kind = "fraud"
+        elif "COUNT" in q_up:
+            kind = "count"
+        elif "SUM" in q_up or "AVG" in q_up:
+            kind = "agg"
+        else:
+            kind = "generic"
         
-        elif "COUNT" in query.upper():
-            # Count prediction
-            if "FOR EACH" in query.upper():
-                num_results = 10
-                return pd.DataFrame({
-                    'ENTITY': range(1, num_results + 1),
-                    'ANCHOR_TIMESTAMP': [pd.Timestamp.now()] * num_results,
-                    'TARGET_PRED': [random.randint(0, 10) for _ in range(num_results)]
-                })
-            else:
-                return pd.DataFrame({
-                    'ENTITY': [1],
-                    'ANCHOR_TIMESTAMP': [pd.Timestamp.now()],
-                    'TARGET_PRED': [random.randint(0, 10)]
-                })
+        # Multiple entities for FOR EACH queries; generic predictions are single
+        num_results = 10 if kind != "generic" and "FOR EACH" in q_up else 1
         
-        elif "SUM" in query.upper() or "AVG" in query.upper():
-            # Aggregation prediction
-            if "FOR EACH" in query.upper():
-                num_results = 10
-                return pd.DataFrame({
-                    'ENTITY': range(1, num_results + 1),
-                    'ANCHOR_TIMESTAMP': [pd.Timestamp.now()] * num_results,
-                    'TARGET_PRED': [random.uniform(1000, 50000) for _ in range(num_results)]
-                })
-            else:
-                return pd.DataFrame({
-                    'ENTITY': [1],
-                    'ANCHOR_TIMESTAMP': [pd.Timestamp.now()],
-                    'TARGET_PRED': [random.uniform(1000, 50000)]
-                })
+        # One timestamp broadcast straight into a datetime64[ns] column
+        anchor = np.full(num_results, np.datetime64(pd.Timestamp.now().value, 'ns'))
         
-        else:
-            # Generic prediction
-            return pd.DataFrame({
-                'ENTITY': [1],
-                'ANCHOR_TIMESTAMP': [pd.Timestamp.now()],
-                'TARGET_PRED': [random.uniform(0, 1)]
-            })
+        return pd.DataFrame({
+            'ENTITY': range(1, num_results + 1),
+            'ANCHOR_TIMESTAMP': anchor,
+            **_PREDICTORS[kind](num_results)
+        })
+
+
+def _predict_fraud(n: int) -> Dict[str, Any]:
+    """Fraud prediction columns."""
+    return {
+        'TARGET_PRED': _rng.integers(0, 2, size=n, dtype=bool),
+        'False_PROB': _rng.uniform(0.3, 0.7, size=n),
+        'True_PROB': _rng.uniform(0.3, 0.7, size=n)
+    }
+
+
+def _predict_count(n: int) -> Dict[str, Any]:
+    """Count prediction columns."""
+    return {'TARGET_PRED': _rng.integers(0, 11, size=n)}
+
+
+def _predict_aggregation(n: int) -> Dict[str, Any]:
+    """Aggregation (SUM/AVG) prediction columns."""
+    return {'TARGET_PRED': _rng.uniform(1000, 50000, size=n)}
+
+
+def _predict_generic(n: int) -> Dict[str, Any]:
+    """Generic prediction columns."""
+    return {'TARGET_PRED': _rng.uniform(0, 1, size=n)}
+
+
+_PREDICTORS = {
+    "fraud": _predict_fraud,
+    "count": _predict_count,
+    "agg": _predict_aggregation,
+    "generic": _predict_generic,
+}
 
 
 def init(api_key: str):
@@ -160,17 +169,35 @@ def init(api_key: str):
     print(f"✓ Mock KumoRFM initialized (demo mode)")
 
 
-# Create mock module structure
-class experimental:
-    class rfm:
-        LocalTable = MockLocalTable
-        LocalGraph = MockLocalGraph
-        KumoRFM = MockKumoRFM
-        init = staticmethod(init)
+# Create mock module structure as real module objects, so each level of
+# kumoai.experimental.rfm has its own namespace
+import sys
+import types
+
+rfm = types.ModuleType('kumoai.experimental.rfm', 'Mock KumoRFM SDK.')
+rfm.LocalTable = MockLocalTable
+rfm.LocalGraph = MockLocalGraph
+rfm.KumoRFM = MockKumoRFM
+rfm.init = init
+
+experimental = types.ModuleType('kumoai.experimental')
+experimental.rfm = rfm
 
 
 # Make it available as kumoai.experimental.rfm
-import sys
-sys.modules['kumoai'] = sys.modules[__name__]
-sys.modules['kumoai.experimental'] = experimental
-sys.modules['kumoai.experimental.rfm'] = experimental.rfm
+
+_installed = False
+
+
+def install():
+    """Register the mock as kumoai.experimental.rfm (idempotent)."""
+    global _installed
+    if _installed:
+        return
+    sys.modules.setdefault('kumoai', sys.modules[__name__])
+    sys.modules.setdefault('kumoai.experimental', experimental)
+    sys.modules.setdefault('kumoai.experimental.rfm', experimental.rfm)
+    _installed = True
+
+
+install()
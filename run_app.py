@@ -3,6 +3,9 @@
 FraudAGENT Launcher - Fixed version without __file__ dependency
 """
 
+import asyncio
+import importlib.util
+import io
 import os
 import sys
 
@@ -15,31 +18,27 @@ os.environ.setdefault('APP_PORT', '7865')
 sys.path.insert(0, os.getcwd())
 sys.path.insert(0, os.path.join(os.getcwd(), 'src'))
 
-# Install mock kumoai
-try:
-    import kumoai
-except ImportError:
+# Install mock kumoai when the real SDK is missing; find_spec checks
+# availability without importing the SDK
+if importlib.util.find_spec('kumoai') is None:
     import mock_kumoai
-    sys.modules['kumoai'] = mock_kumoai
-    sys.modules['kumoai.experimental'] = mock_kumoai
-    sys.modules['kumoai.experimental.rfm'] = mock_kumoai
+    mock_kumoai.install()
 
 # Now import and run the application
 from dotenv import load_dotenv
 load_dotenv()
 
-from src.data_loader import InsuranceDataLoader
-from src.kumo_setup import KumoSetup
-from src.text_to_pql import TextToPQLTranslator
-from src.kumo_agent import KumoConversationAgent
+# Data, KumoRFM and agent modules are imported in main() once a data source
+# is found, so upload-only mode does not pay for them
+from src.pipeline import configure_logging, flush_log, has_uploaded_data
 from src.upload_ui import DataUploadUI
 import gradio as gr
 
 
 def determine_data_source():
     """Determine which data source to use based on priority."""
-    # Priority 1: uploaded_data directory
-    if os.path.exists("uploaded_data") and os.listdir("uploaded_data"):
+    # Priority 1: uploaded_data directory (single scandir probe)
+    if has_uploaded_data("uploaded_data"):
         return "uploaded_data"
     
     # Priority 2: Environment variable
@@ -56,6 +55,7 @@ def determine_data_source():
 
 def main():
     """Main application entry point."""
+    configure_logging()
     
     print("\n" + "="*80)
     print("🏥 KUMORFM INSURANCE CLAIMS AI AGENT - FRAUDAGENT")
@@ -83,6 +83,11 @@ def main():
     
     print(f"\n📊 Using data source: {data_source}\n")
     
+    from src.data_loader import InsuranceDataLoader
+    from src.kumo_setup import KumoSetup
+    from src.text_to_pql import TextToPQLTranslator
+    from src.kumo_agent import KumoConversationAgent
+    
     # Phase 1: Load Data
     print("="*80)
     print("PHASE 1: DATA LOADING AND PROFILING")
@@ -96,55 +101,72 @@ def main():
     
     print("\n✅ Phase 1 complete: Data loaded and profiled")
     
-    # Phase 2: Initialize KumoRFM
-    print("\n" + "="*80)
-    print("PHASE 2: KUMORFM INITIALIZATION")
-    print("="*80)
-    
-    kumo = KumoSetup()
-    kumo.import_dataset(tables, schema_info)
-    graph_obj = kumo.create_graph(tables)
-    kumo.materialize_graph()
-    
-    print("\n✅ Phase 2 complete: KumoRFM initialized and graph materialized")
-    
-    # Phase 3: Initialize Translator
+    # Phases 2, 3 and 5 only depend on Phase 1, so they run concurrently on
+    # worker threads: translator setup and the upload UI overlap with graph
+    # materialization. Phase 4 needs both KumoRFM and the translator. One
+    # banner covers the three phases, and each phase reports its completion
+    # in a single write, so their reports do not interleave.
     print("\n" + "="*80)
-    print("PHASE 3: NL TO PQL TRANSLATOR INITIALIZATION")
+    print("PHASES 2, 3 AND 5: KUMORFM, NL TO PQL TRANSLATOR AND UPLOAD UI (CONCURRENT)")
     print("="*80)
     
-    # Create a JSON-serializable schema dictionary
-    # Convert schema_info to JSON-serializable format (convert Timestamps to strings)
-    import json
-    import pandas as pd
-    
-    def make_json_serializable(obj):
-        """Recursively convert non-JSON-serializable objects to strings."""
-        if isinstance(obj, (pd.Timestamp, pd.Timedelta)):
-            return str(obj)
-        elif isinstance(obj, dict):
-            return {k: make_json_serializable(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [make_json_serializable(item) for item in obj]
-        elif isinstance(obj, tuple):
-            return tuple(make_json_serializable(item) for item in obj)
-        else:
-            return obj
+    def init_kumo():
+        # Phase 2: Initialize KumoRFM
+        kumo = KumoSetup()
+        kumo.import_dataset(tables, schema_info)
+        kumo.create_graph(tables)
+        kumo.materialize_graph()
+        
+        log = io.StringIO()
+        print("\n✅ Phase 2 complete: KumoRFM initialized and graph materialized", file=log)
+        flush_log(log)
+        return kumo
     
-    # Convert schema_info to JSON-serializable format
-    serializable_schema = make_json_serializable(schema_info)
+    def init_translator():
+        # Phase 3: Initialize Translator
+        # Create a JSON-serializable schema dictionary: a single orjson round
+        # trip (orjson ships with gradio) converts numpy scalars natively and
+        # stringifies Timestamps and other non-JSON values
+        import orjson
+        
+        serializable_schema = orjson.loads(orjson.dumps(
+            schema_info,
+            default=str,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        ))
+        
+        graph_schema = {
+            "tables": list(tables.keys()),
+            "schema_info": serializable_schema
+        }
+        
+        translator = TextToPQLTranslator(
+            graph_schema=graph_schema,
+            model=os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+        )
+        
+        log = io.StringIO()
+        print("\n✅ Phase 3 complete: Translator initialized with model", os.getenv("OPENAI_MODEL", "gpt-4o-mini"), file=log)
+        flush_log(log)
+        return translator, graph_schema
     
-    graph_schema = {
-        "tables": list(tables.keys()),
-        "schema_info": serializable_schema
-    }
+    def init_upload_ui():
+        # Phase 5: Create Upload UI
+        upload_ui = DataUploadUI()
+        
+        log = io.StringIO()
+        print("\n✅ Phase 5 complete: Upload UI created", file=log)
+        flush_log(log)
+        return upload_ui
     
-    translator = TextToPQLTranslator(
-        graph_schema=graph_schema,
-        model=os.getenv("OPENAI_MODEL", "gpt-4o-mini")
-    )
+    async def run_independent_phases():
+        return await asyncio.gather(
+            asyncio.to_thread(init_kumo),
+            asyncio.to_thread(init_translator),
+            asyncio.to_thread(init_upload_ui)
+        )
     
-    print("\n✅ Phase 3 complete: Translator initialized with model", os.getenv("OPENAI_MODEL", "gpt-4o-mini"))
+    kumo, (translator, graph_schema), upload_ui = asyncio.run(run_independent_phases())
     
     # Phase 4: Create Agent
     print("\n" + "="*80)
@@ -159,15 +181,6 @@ def main():
     
     print("\n✅ Phase 4 complete: Conversational agent created")
     
-    # Phase 5: Create Upload UI
-    print("\n" + "="*80)
-    print("PHASE 5: CREATING UPLOAD UI")
-    print("="*80)
-    
-    upload_ui = DataUploadUI()
-    
-    print("\n✅ Phase 5 complete: Upload UI created")
-    
     # Phase 6: Create Gradio Interface
     print("\n" + "="*80)
     print("PHASE 6: LAUNCHING GRADIO INTERFACE")
@@ -3,11 +3,32 @@ Insurance Data Loader Module (Version 2 - with Upload Support)
 Loads and profiles insurance claims data from Parquet files or uploaded directory.
 """
 
+import numpy as np
 import pandas as pd
+import pyarrow.dataset as ds
+import pyarrow.fs as pafs
+import pyarrow.parquet as pq
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, List
 import json
+import orjson
+
+
+# Profile cache file shared by all data paths, which key its entries. Off
+# unless PROFILE_CACHE_PATH names the file
+PROFILE_CACHE_PATH_ENV = "PROFILE_CACHE_PATH"
+# Bump when the profile layout changes so stale entries are ignored
+PROFILE_CACHE_VERSION = 1
+
+
+def _to_pandas(table) -> pd.DataFrame:
+    """
+    Convert an Arrow table to pandas, releasing Arrow buffers as columns are
+    handed over instead of holding both copies until the end.
+    """
+    return table.to_pandas(split_blocks=True, self_destruct=True)
 
 
 class InsuranceDataLoader:
@@ -26,6 +47,7 @@ class InsuranceDataLoader:
         self.data_path = data_path
         self.tables = {}
         self.schema_info = {}
+        self._metadata = {}
         
         # Determine if path is file or directory
         if os.path.isfile(data_path):
@@ -34,6 +56,84 @@ class InsuranceDataLoader:
             self.mode = "directory"
         else:
             raise ValueError(f"Invalid data path: {data_path}")
+        
+        self._fingerprints = self._fingerprint_files()
+    
+    def _fingerprint_files(self) -> Dict[str, List[int]]:
+        """Fingerprint each Parquet file by (mtime_ns, size) without reading it."""
+        if self.mode == "single_file":
+            paths = [self.data_path]
+        else:
+            paths = [
+                entry.path for entry in os.scandir(self.data_path)
+                if entry.name.endswith(".parquet") and entry.is_file()
+            ]
+        
+        fingerprints = {}
+        for path in sorted(paths):
+            st = os.stat(path)
+            fingerprints[Path(path).stem] = [st.st_mtime_ns, st.st_size]
+        return fingerprints
+    
+    @staticmethod
+    def _profile_cache_path() -> str:
+        """Location of the profile cache, or an empty string if disabled."""
+        cache_path = os.getenv(PROFILE_CACHE_PATH_ENV, "")
+        return os.path.expanduser(cache_path) if cache_path else ""
+    
+    def _load_cached_profile(self):
+        """
+        Return the cached schema info if the data files are unchanged.
+        
+        Returns:
+            Schema information dictionary, or None on a cache miss
+        """
+        cache_path = self._profile_cache_path()
+        if not cache_path:
+            return None
+        try:
+            with open(cache_path, 'r') as f:
+                entry = json.load(f).get(os.path.abspath(self.data_path))
+        except (OSError, ValueError, AttributeError):
+            return None
+        
+        if (not entry or entry.get('version') != PROFILE_CACHE_VERSION
+                or entry.get('fingerprints') != self._fingerprints):
+            return None
+        schema_info = entry.get('schema_info', {})
+        if set(schema_info) != set(self.tables):
+            return None
+        return schema_info
+    
+    def _save_cached_profile(self):
+        """Store the schema info keyed by this data path; failures are non-fatal."""
+        cache_path = self._profile_cache_path()
+        if not cache_path:
+            return
+        # Normalized once to what the cache stores (non-JSON samples such as
+        # timestamps become strings), so this run returns what a hit would
+        self.schema_info = json.loads(json.dumps(self.schema_info, default=str))
+        try:
+            with open(cache_path, 'r') as f:
+                cache = json.load(f)
+            if not isinstance(cache, dict):
+                cache = {}
+        except (OSError, ValueError):
+            cache = {}
+        
+        cache[os.path.abspath(self.data_path)] = {
+            'version': PROFILE_CACHE_VERSION,
+            'fingerprints': self._fingerprints,
+            'schema_info': self.schema_info
+        }
+        try:
+            os.makedirs(os.path.dirname(cache_path) or ".", exist_ok=True)
+            tmp_path = f"{cache_path}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(cache, f, default=str)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
     
     def load_data(self) -> Dict[str, pd.DataFrame]:
         """
@@ -47,9 +147,8 @@ class InsuranceDataLoader:
         
         if self.mode == "single_file":
             # Load single Parquet file
-            df = pd.read_parquet(self.data_path)
             table_name = Path(self.data_path).stem
-            self.tables[table_name] = df
+            df = self._read_table(table_name, self.data_path)
             print(f"✓ Loaded table '{table_name}': {df.shape[0]} rows × {df.shape[1]} columns")
         
         elif self.mode == "directory":
@@ -61,11 +160,24 @@ class InsuranceDataLoader:
             
             print(f"Found {len(parquet_files)} Parquet files")
             
-            for file_path in sorted(parquet_files):
-                table_name = file_path.stem
-                df = pd.read_parquet(file_path)
-                self.tables[table_name] = df
-                print(f"✓ Loaded table '{table_name}': {df.shape[0]} rows × {df.shape[1]} columns")
+            # Open all files as one Arrow dataset (one filesystem and scan
+            # setup), then decode the per-file fragments concurrently;
+            # pyarrow releases the GIL and already uses threads within a
+            # file, so the pool is kept small
+            parquet_files = sorted(parquet_files)
+            dataset = ds.dataset(
+                [str(p) for p in parquet_files],
+                format="parquet",
+                filesystem=pafs.LocalFileSystem(use_mmap=True)
+            )
+            fragments = list(dataset.get_fragments())
+            max_workers = min(8, len(fragments), max(1, (os.cpu_count() or 1) // 2))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = executor.map(self._read_fragment, fragments)
+                for fragment, (df, metadata) in zip(fragments, results):
+                    table_name = Path(fragment.path).stem
+                    self._register_table(table_name, df, metadata)
+                    print(f"✓ Loaded table '{table_name}': {df.shape[0]} rows × {df.shape[1]} columns")
             
             # Check for metadata file
             metadata_path = Path(self.data_path) / "upload_metadata.json"
@@ -78,10 +190,135 @@ class InsuranceDataLoader:
         print(f"\n✅ Loaded {len(self.tables)} table(s)")
         return self.tables
     
+    def _read_table(self, table_name: str, file_path) -> pd.DataFrame:
+        """
+        Read a Parquet file through a pyarrow handle and register the table.
+        
+        The file footer is parsed once here and cached, so profiling and the
+        duplicate check can answer shape and statistics questions from it.
+        """
+        df, metadata = self._read_parquet(file_path)
+        self._register_table(table_name, df, metadata)
+        return df
+    
+    @staticmethod
+    def _read_parquet(file_path):
+        """Read a Parquet file, returning the DataFrame and its footer metadata."""
+        parquet_file = pq.ParquetFile(file_path, memory_map=True)
+        return _to_pandas(parquet_file.read()), parquet_file.metadata
+    
+    @staticmethod
+    def _read_fragment(fragment: ds.ParquetFileFragment):
+        """Read one dataset fragment, returning the DataFrame and its footer metadata."""
+        return _to_pandas(fragment.to_table(use_threads=True)), fragment.metadata
+    
+    def _register_table(self, table_name: str, df: pd.DataFrame, metadata) -> None:
+        """Store a loaded table and its cached footer metadata."""
+        self._metadata[table_name] = metadata
+        self.tables[table_name] = df
+    
+    def _column_statistics(self, table_name: str) -> Dict[str, list]:
+        """
+        Collect per-row-group footer statistics for each top-level column.
+        
+        Columns where any row group lacks statistics are left out.
+        """
+        metadata = self._metadata.get(table_name)
+        if metadata is None:
+            return {}
+        
+        stats_by_column = {}
+        for j in range(metadata.num_columns):
+            column_stats = []
+            for i in range(metadata.num_row_groups):
+                column = metadata.row_group(i).column(j)
+                if column.statistics is None:
+                    column_stats = None
+                    break
+                column_stats.append(column.statistics)
+            if column_stats is not None:
+                stats_by_column[metadata.schema.column(j).path] = column_stats
+        return stats_by_column
+    
+    def _profile_table(self, table_name: str) -> Dict:
+        """
+        Profile a single table.
+        
+        Runs on a worker thread, so it only reads shared state and returns
+        the schema instead of printing or storing it.
+        """
+        df = self.tables[table_name]
+        metadata = self._metadata.get(table_name)
+        if metadata is not None:
+            # Row count comes from the Parquet footer, no column data needed
+            row_count = metadata.num_rows
+            column_count = len(df.columns)
+        else:
+            row_count, column_count = df.shape
+        column_stats = self._column_statistics(table_name)
+        
+        schema = {
+            'name': table_name,
+            'row_count': row_count,
+            'column_count': column_count,
+            'columns': {},
+            'primary_key': None,
+            # Temporal columns come straight from the dtypes
+            'temporal_columns': [
+                col for col, dtype in df.dtypes.items()
+                if pd.api.types.is_datetime64_any_dtype(dtype)
+            ]
+        }
+        
+        # Analyze columns one at a time, without full-column copies
+        for col, series in df.items():
+            stats = column_stats.get(col)
+            if stats and all(st.has_null_count for st in stats):
+                # Null counts are summed from the footer statistics
+                null_count = sum(st.null_count for st in stats)
+            elif isinstance(series.dtype, np.dtype) and series.dtype.kind in 'iub':
+                # NumPy integer and bool columns cannot hold nulls
+                null_count = 0
+            else:
+                null_count = int(series.isnull().sum())
+            if stats and len(stats) == 1 and stats[0].has_distinct_count:
+                # Distinct count recorded by the writer, no hashing needed
+                unique_count = stats[0].distinct_count
+            else:
+                unique_count = int(series.nunique())
+            
+            # Samples come from the head of the column; only fall back to a
+            # full dropna() when the head is mostly nulls
+            samples = series.head(64).dropna().head(3)
+            if len(samples) < 3 and null_count < row_count:
+                samples = series.dropna().head(3)
+            
+            col_info = {
+                'dtype': str(series.dtype),
+                'null_count': null_count,
+                'unique_count': unique_count,
+                'sample_values': samples.tolist()
+            }
+            
+            # Detect primary key
+            if unique_count == row_count and null_count == 0:
+                if 'id' in col.lower() or 'number' in col.lower():
+                    schema['primary_key'] = col
+            
+            schema['columns'][col] = col_info
+        
+        return schema
+    
     def profile_data(self) -> Dict:
         """
         Profile the loaded data and generate schema information.
         
+        Tables are profiled concurrently; pyarrow and the pandas reductions
+        release the GIL, so wall time approaches that of the largest table.
+        When PROFILE_CACHE_PATH is set, results are cached in that file and
+        reused while the Parquet files keep the same modification time and
+        size.
+        
         Returns:
             Dictionary containing schema information for all tables
         """
@@ -89,39 +326,27 @@ class InsuranceDataLoader:
         print("DATA PROFILING")
         print("="*80)
         
-        for table_name, df in self.tables.items():
+        table_names = list(self.tables)
+        schemas = self._load_cached_profile()
+        cache_hit = schemas is not None
+        if cache_hit:
+            print("✓ Using cached profile (data files unchanged)")
+        else:
+            schemas = {}
+        if table_names and not cache_hit:
+            with ThreadPoolExecutor(max_workers=min(8, len(table_names))) as executor:
+                futures = {
+                    executor.submit(self._profile_table, table_name): table_name
+                    for table_name in table_names
+                }
+                for future in as_completed(futures):
+                    schemas[futures[future]] = future.result()
+        
+        # Report in load order so the output stays deterministic
+        for table_name in table_names:
+            schema = schemas[table_name]
             print(f"\n📊 Table: {table_name}")
             print("-" * 80)
-            
-            schema = {
-                'name': table_name,
-                'row_count': len(df),
-                'column_count': len(df.columns),
-                'columns': {},
-                'primary_key': None,
-                'temporal_columns': []
-            }
-            
-            # Analyze columns
-            for col in df.columns:
-                col_info = {
-                    'dtype': str(df[col].dtype),
-                    'null_count': int(df[col].isnull().sum()),
-                    'unique_count': int(df[col].nunique()),
-                    'sample_values': df[col].dropna().head(3).tolist()
-                }
-                
-                # Detect primary key
-                if df[col].nunique() == len(df) and df[col].notnull().all():
-                    if 'id' in col.lower() or 'number' in col.lower():
-                        schema['primary_key'] = col
-                
-                # Detect temporal columns
-                if pd.api.types.is_datetime64_any_dtype(df[col]):
-                    schema['temporal_columns'].append(col)
-                
-                schema['columns'][col] = col_info
-            
             print(f"  Rows: {schema['row_count']:,}")
             print(f"  Columns: {schema['column_count']}")
             if schema['primary_key']:
@@ -131,6 +356,9 @@ class InsuranceDataLoader:
             
             self.schema_info[table_name] = schema
         
+        if not cache_hit:
+            self._save_cached_profile()
+        
         print("\n✅ Data profiling complete")
         return self.schema_info
     
@@ -143,10 +371,17 @@ class InsuranceDataLoader:
         for table_name, schema in self.schema_info.items():
             if schema['temporal_columns']:
                 print(f"\n📅 Table: {table_name}")
+                column_stats = self._column_statistics(table_name)
                 for col in schema['temporal_columns']:
-                    df = self.tables[table_name]
-                    min_date = df[col].min()
-                    max_date = df[col].max()
+                    stats = column_stats.get(col)
+                    if stats and all(st.has_min_max for st in stats):
+                        # Range comes from the footer, no column scan needed
+                        min_date = pd.Timestamp(min(st.min for st in stats))
+                        max_date = pd.Timestamp(max(st.max for st in stats))
+                    else:
+                        df = self.tables[table_name]
+                        min_date = df[col].min()
+                        max_date = df[col].max()
                     print(f"  {col}: {min_date} to {max_date}")
     
     def check_duplicates(self):
@@ -156,7 +391,20 @@ class InsuranceDataLoader:
         print("="*80)
         
         for table_name, df in self.tables.items():
-            duplicates = df.duplicated().sum()
+            primary_key = self.schema_info.get(table_name, {}).get('primary_key')
+            if primary_key:
+                stats = self._column_statistics(table_name).get(primary_key)
+                if (stats and len(stats) == 1 and stats[0].has_distinct_count
+                        and stats[0].distinct_count == len(df)):
+                    # The footer already proves the key is unique
+                    duplicates = 0
+                else:
+                    # Only the key column needs hashing, not every full row
+                    duplicates = int(df[primary_key].duplicated().sum())
+            else:
+                # One uint64 hash per row, so duplicated() compares 8 bytes
+                # per row instead of every column
+                duplicates = int(pd.util.hash_pandas_object(df, index=False).duplicated().sum())
             if duplicates > 0:
                 print(f"⚠️  {table_name}: {duplicates} duplicate rows found")
             else:
@@ -172,6 +420,10 @@ class InsuranceDataLoader:
     
     def export_schema(self, output_file: str = "data_schema_summary.json"):
         """Export schema information to JSON file."""
-        with open(output_file, 'w') as f:
-            json.dump(self.schema_info, f, indent=2, default=str)
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(
+                self.schema_info,
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+            ))
         print(f"\n✅ Schema exported to: {output_file}")
@@ -4,8 +4,11 @@ Loads and profiles insurance claims data from Parquet files.
 """
 
 import os
-import json
+import orjson
+import numpy as np
 import pandas as pd
+import pyarrow.parquet as pq
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple, Any
 from pathlib import Path
 
@@ -26,6 +29,7 @@ class InsuranceDataLoader:
         self.data_path = Path(data_path)
         self.tables: Dict[str, pd.DataFrame] = {}
         self.schema_info: Dict[str, Any] = {}
+        self._metadata: Dict[str, pq.FileMetaData] = {}
         
     def load_data(self) -> Dict[str, pd.DataFrame]:
         """
@@ -39,8 +43,7 @@ class InsuranceDataLoader:
         if self.data_path.is_file():
             # Single parquet file
             table_name = self.data_path.stem
-            df = pd.read_parquet(self.data_path)
-            self.tables[table_name] = df
+            df = self._read_table(table_name, self.data_path)
             print(f"✓ Loaded table '{table_name}': {df.shape[0]} rows, {df.shape[1]} columns")
             
         elif self.data_path.is_dir():
@@ -50,9 +53,15 @@ class InsuranceDataLoader:
             if not parquet_files:
                 raise FileNotFoundError(f"No parquet files found in {self.data_path}")
             
-            for file_path in parquet_files:
+            # Decode files concurrently; pyarrow releases the GIL and already
+            # uses threads within a file, so the pool is kept small
+            max_workers = min(8, len(parquet_files), max(1, (os.cpu_count() or 1) // 2))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(self._read_parquet, parquet_files))
+            
+            for file_path, (df, metadata) in zip(parquet_files, results):
                 table_name = file_path.stem
-                df = pd.read_parquet(file_path)
+                self._metadata[table_name] = metadata
                 self.tables[table_name] = df
                 print(f"✓ Loaded table '{table_name}': {df.shape[0]} rows, {df.shape[1]} columns")
         else:
@@ -60,6 +69,45 @@ class InsuranceDataLoader:
         
         return self.tables
     
+    def _read_table(self, table_name: str, file_path: Path) -> pd.DataFrame:
+        """
+        Read a Parquet file through a pyarrow handle and register the table.
+        
+        The footer is kept so row counts can be answered without touching
+        column data.
+        
+        Args:
+            table_name: Name to register the table under
+            file_path: Path to the Parquet file
+            
+        Returns:
+            Loaded DataFrame
+        """
+        df, metadata = self._read_parquet(file_path)
+        self._metadata[table_name] = metadata
+        self.tables[table_name] = df
+        return df
+    
+    @staticmethod
+    def _read_parquet(file_path: Path) -> Tuple[pd.DataFrame, pq.FileMetaData]:
+        """
+        Read a Parquet file into a DataFrame along with its footer metadata.
+        
+        Each column becomes its own block (no consolidation copy into 2D
+        blocks) and Arrow buffers are released as they are handed over.
+        
+        Args:
+            file_path: Path to the Parquet file
+            
+        Returns:
+            Tuple of (DataFrame, footer metadata)
+        """
+        parquet_file = pq.ParquetFile(file_path, memory_map=True)
+        return (
+            parquet_file.read().to_pandas(split_blocks=True, self_destruct=True),
+            parquet_file.metadata
+        )
+    
     def profile_data(self) -> Dict[str, Any]:
         """
         Profile loaded data: schema, dtypes, nulls, unique values, likely PKs, datetime columns.
@@ -83,37 +131,52 @@ class InsuranceDataLoader:
             print(f"\n📊 Table: {table_name}")
             print("-" * 80)
             
-            # Basic info
-            num_rows, num_cols = df.shape
+            # Basic info (row count from the Parquet footer when available)
+            metadata = self._metadata.get(table_name)
+            num_rows = metadata.num_rows if metadata is not None else len(df)
+            num_cols = len(df.columns)
             print(f"Shape: {num_rows} rows × {num_cols} columns")
             
-            # Column analysis
+            # Column analysis: whole-frame reductions, then a plain loop to
+            # assemble the per-column info
+            # NumPy integer and bool columns cannot hold nulls, so only the
+            # remaining columns are scanned
+            nullable = [
+                col for col, dtype in df.dtypes.items()
+                if not (isinstance(dtype, np.dtype) and dtype.kind in 'iub')
+            ]
+            null_counts = df[nullable].isna().sum().reindex(df.columns, fill_value=0)
+            unique_counts = df.nunique()
+            pct_scale = 100.0 / num_rows if num_rows > 0 else 0.0
+            null_pcts = null_counts * pct_scale
+            unique_pcts = unique_counts * pct_scale
+            
             column_info = {}
             likely_pks = []
-            likely_datetime_cols = []
             
-            for col in df.columns:
-                dtype = str(df[col].dtype)
-                null_count = df[col].isnull().sum()
-                null_pct = (null_count / num_rows) * 100 if num_rows > 0 else 0
-                unique_count = df[col].nunique()
-                unique_pct = (unique_count / num_rows) * 100 if num_rows > 0 else 0
-                
+            # Datetime columns by name or dtype, checked over the whole
+            # column Index at once
+            is_dt_by_name = df.columns.str.lower().str.contains('date|time', regex=True)
+            is_dt_by_dtype = df.dtypes.map(pd.api.types.is_datetime64_any_dtype).to_numpy(dtype=bool)
+            likely_datetime_cols = df.columns[is_dt_by_name | is_dt_by_dtype].tolist()
+            
+            # Walk plain lists in column order instead of per-label lookups
+            for col, dtype, null_count, unique_count, null_pct, unique_pct in zip(
+                df.columns, df.dtypes.astype(str).tolist(),
+                null_counts.tolist(), unique_counts.tolist(),
+                null_pcts.tolist(), unique_pcts.tolist()
+            ):
                 column_info[col] = {
                     "dtype": dtype,
-                    "null_count": int(null_count),
+                    "null_count": null_count,
                     "null_percentage": round(null_pct, 2),
-                    "unique_count": int(unique_count),
+                    "unique_count": unique_count,
                     "unique_percentage": round(unique_pct, 2)
                 }
                 
                 # Detect likely primary keys (high uniqueness, low nulls)
                 if unique_pct > 95 and null_pct < 5:
                     likely_pks.append(col)
-                
-                # Detect datetime columns
-                if 'date' in col.lower() or 'time' in col.lower() or dtype.startswith('datetime'):
-                    likely_datetime_cols.append(col)
             
             # Print column details
             print(f"\nColumns ({num_cols}):")
@@ -126,9 +189,13 @@ class InsuranceDataLoader:
                 print(f"  • {col}: {info['dtype']} | Nulls: {info['null_count']} ({info['null_percentage']}%) | "
                       f"Unique: {info['unique_count']} ({info['unique_percentage']}%){marker}")
             
-            # Sample rows
-            print(f"\nSample rows (first 3):")
-            print(df.head(3).to_string())
+            # Sample rows, bounded so wide tables do not format every cell
+            if num_cols > 50:
+                print(f"\nSample rows skipped ({num_cols} columns); use get_dataframes() to inspect")
+            else:
+                print(f"\nSample rows (first 3):")
+                preview = df.iloc[:3, :min(10, num_cols)]
+                print(preview.to_string(max_colwidth=20))
             
             # Store schema info
             self.schema_info["tables"][table_name] = {
@@ -161,12 +228,12 @@ class InsuranceDataLoader:
             print(f"\n📅 Table: {table_name}")
             for col in datetime_cols:
                 try:
-                    # Try to parse as datetime
+                    # Try to parse as datetime; pandas infers the format from
+                    # the first value and cache=True parses repeats once
                     if not pd.api.types.is_datetime64_any_dtype(df[col]):
-                        self.tables[table_name][col] = pd.to_datetime(df[col], errors='coerce')
+                        self.tables[table_name][col] = pd.to_datetime(df[col], errors='coerce', cache=True)
                     
-                    min_date = df[col].min()
-                    max_date = df[col].max()
+                    min_date, max_date = df[col].agg(['min', 'max'])
                     print(f"  ✓ {col}: {min_date} to {max_date}")
                 except Exception as e:
                     print(f"  ✗ {col}: Failed to parse - {e}")
@@ -185,11 +252,13 @@ class InsuranceDataLoader:
             
             if not likely_pks:
                 print(f"\n⚠ Table '{table_name}': No likely primary key detected, checking full row duplicates")
-                dup_count = df.duplicated().sum()
+                # One uint64 hash per row, so duplicated() compares 8 bytes
+                # per row instead of every column
+                dup_count = int(pd.util.hash_pandas_object(df, index=False).duplicated().sum())
             else:
                 pk = likely_pks[0]  # Use first likely PK
                 print(f"\n🔑 Table '{table_name}': Checking duplicates on '{pk}'")
-                dup_count = df.duplicated(subset=[pk]).sum()
+                dup_count = int(df[pk].duplicated().sum())
             
             if dup_count > 0:
                 print(f"  ⚠ Found {dup_count} duplicate(s)")
@@ -210,8 +279,12 @@ class InsuranceDataLoader:
             raise ValueError("No schema info available. Call profile_data() first.")
         
         output_file = Path(output_path)
-        with open(output_file, 'w') as f:
-            json.dump(self.schema_info, f, indent=2, default=str)
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(
+                self.schema_info,
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+            ))
         
         print(f"\n✓ Schema summary exported to: {output_file}")
         return str(output_file)
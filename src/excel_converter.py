@@ -4,13 +4,233 @@ Converts Excel (.xlsx) files with multiple sheets to Parquet format
 and prepares them for KumoRFM graph inference.
 """
 
-import pandas as pd
+import importlib.util
+import io
+import multiprocessing
 import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Tuple
-import json
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+import orjson
 from datetime import datetime
 
+# pandas, NumPy and pyarrow are imported inside the methods that use them so
+# that the CLI's usage and missing-file paths exit without loading them.
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+
+# Share of a key-shaped column's distinct values that must appear in another
+# table's primary key for the column to be taken as a foreign key
+_FK_MIN_OVERLAP = 0.9
+
+# Smallest Parquet row group written for a sheet
+_MIN_ROW_GROUP_ROWS = 64_000
+
+# Rows converted to Arrow at a time when streaming an openpyxl sheet
+_STREAM_BATCH_ROWS = 64_000
+
+# Smallest workbook (compressed .xlsx bytes) converted on a process pool;
+# below this, spawning workers that re-import pandas and pyarrow and reading
+# their output back costs more than parsing the sheets in-process
+_PARALLEL_MIN_BYTES = 16 << 20
+
+
+@lru_cache(maxsize=1)
+def _excel_engine() -> Optional[str]:
+    """
+    Pick the Excel reader engine.
+    
+    Uses the Rust-based calamine engine when python-calamine is installed
+    (pandas >= 2.2), which parses sheets several times faster than openpyxl;
+    otherwise returns None so pandas picks its default engine for the file.
+    """
+    if importlib.util.find_spec("python_calamine") is not None:
+        return "calamine"
+    return None
+
+
+def _read_sheet_streaming(worksheet) -> Optional["pd.DataFrame"]:
+    """
+    Read a read-only openpyxl worksheet in row batches through Arrow.
+    
+    pandas' openpyxl reader collects the whole sheet as Python row lists
+    before building the frame; here at most _STREAM_BATCH_ROWS rows of Python
+    values exist at once, each batch converted to columnar Arrow arrays.
+    Blank rows are skipped, as read_excel does. Returns None when the sheet
+    needs pandas' full parser: missing or duplicate headers, data beyond
+    the header columns, or a column mixing incompatible types.
+    """
+    import pyarrow as pa
+    
+    rows = worksheet.iter_rows(values_only=True)
+    header = next(rows, None)
+    if header is None:
+        return None
+    header = list(header)
+    while header and header[-1] is None:
+        header.pop()
+    names = [str(h) for h in header]
+    if not names or None in header or len(set(names)) != len(names):
+        return None
+    
+    width = len(names)
+    batches = []
+    columns = [[] for _ in range(width)]
+    n_rows = 0
+    try:
+        for row in rows:
+            if len(row) > width and any(v is not None for v in row[width:]):
+                return None
+            if all(v is None for v in row[:width]):
+                continue
+            for i in range(width):
+                columns[i].append(row[i] if i < len(row) else None)
+            n_rows += 1
+            if n_rows == _STREAM_BATCH_ROWS:
+                batches.append(pa.table(dict(zip(names, map(pa.array, columns)))))
+                columns = [[] for _ in range(width)]
+                n_rows = 0
+        if n_rows or not batches:
+            batches.append(pa.table(dict(zip(names, map(pa.array, columns)))))
+        # Batches may infer different types (e.g. int then float, or all-null
+        # first); permissive promotion unifies them
+        table = pa.concat_tables(batches, promote_options="permissive")
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        return None
+    return table.to_pandas()
+
+
+def _footer_null_counts(
+    metadata: "pq.FileMetaData",
+    columns: List[str],
+    num_rows: int
+) -> Optional[Dict[str, int]]:
+    """
+    Per-column null counts summed from a Parquet file's row-group statistics.
+    
+    Uses only the footer metadata. Returns None if its columns or row count
+    differ from the frame's, or any column chunk lacks a null count.
+    """
+    names = [metadata.schema.column(i).path for i in range(metadata.num_columns)]
+    if metadata.num_rows != num_rows or names != [str(c) for c in columns]:
+        return None
+    
+    counts = dict.fromkeys(columns, 0)
+    for r in range(metadata.num_row_groups):
+        row_group = metadata.row_group(r)
+        for i, col in enumerate(columns):
+            stats = row_group.column(i).statistics
+            if stats is None or not stats.has_null_count:
+                return None
+            counts[col] += stats.null_count
+    return counts
+
+
+def _key_values(series: "pd.Series") -> Tuple["pd.Index", Optional["pa.Array"]]:
+    """
+    Distinct non-null values of a key column, as a pandas Index and, when
+    the values convert cleanly, an Arrow array for hash-set matching.
+    """
+    import pandas as pd
+    import pyarrow as pa
+    
+    index = pd.Index(series.dropna().unique())
+    try:
+        array = pa.array(index.to_numpy())
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        array = None
+    return index, array
+
+
+def _overlap(values: tuple, keys: tuple) -> float:
+    """Share of `values` found in `keys`, both as returned by _key_values."""
+    import pyarrow.compute as pc
+    
+    if values[1] is not None and keys[1] is not None and values[1].type == keys[1].type:
+        return pc.mean(pc.is_in(values[1], value_set=keys[1])).as_py()
+    return values[0].isin(keys[0]).mean()
+
+
+def _parse_sheet(excel_file, sheet_name: str) -> "pd.DataFrame":
+    """Read one sheet, streaming it when the workbook is opened with openpyxl."""
+    df = None
+    # openpyxl sheets are streamed in batches; other engines and sheets the
+    # streaming reader rejects use pandas
+    if excel_file.engine == "openpyxl":
+        df = _read_sheet_streaming(excel_file.book[sheet_name])
+    if df is None:
+        df = excel_file.parse(sheet_name)
+    return df
+
+
+def _write_sheet(
+    df: "pd.DataFrame",
+    sheet_name: str,
+    output_dir: str,
+    compression: str,
+    compression_level: Optional[int]
+) -> Tuple[str, "pd.DataFrame", str, "pq.FileMetaData"]:
+    """
+    Write a sheet to Parquet.
+    
+    Returns (table_name, df, path, metadata), where metadata is the footer
+    the writer produced, so callers need not read the file back.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    
+    # Clean table name (remove _fact suffix if present, make lowercase)
+    table_name = sheet_name.replace('_fact', '').lower()
+    
+    # Save as Parquet. The Arrow table is built directly (numeric blocks are
+    # wrapped without copying) and handed to the Parquet writer, bypassing
+    # the DataFrame.to_parquet dispatch layer.
+    parquet_path = os.path.join(output_dir, f"{table_name}.parquet")
+    metadata_collector = []
+    pq.write_table(
+        pa.Table.from_pandas(df, preserve_index=False),
+        parquet_path,
+        compression=compression,
+        compression_level=compression_level,
+        use_dictionary=True,
+        write_statistics=True,
+        data_page_size=1 << 20,
+        # Large sheets are split into ~8 row groups so downstream readers can
+        # prune and scan them in parallel
+        row_group_size=max(_MIN_ROW_GROUP_ROWS, len(df) // 8),
+        metadata_collector=metadata_collector
+    )
+    return table_name, df, parquet_path, metadata_collector[0]
+
+
+def _convert_one_sheet(
+    excel_file_path: str,
+    sheet_name: str,
+    output_dir: str,
+    compression: str,
+    compression_level: Optional[int]
+) -> Tuple[str, str, "pq.FileMetaData"]:
+    """
+    Convert one sheet in a worker process; returns (table_name, path, metadata).
+    
+    Each worker opens its own workbook handle, so sheets are parsed in
+    parallel rather than serialized on a shared reader. Only the footer
+    metadata travels back to the parent, not the pickled DataFrame.
+    """
+    import pandas as pd
+    
+    with pd.ExcelFile(excel_file_path, engine=_excel_engine()) as excel_file:
+        df = _parse_sheet(excel_file, sheet_name)
+    table_name, _, parquet_path, metadata = _write_sheet(
+        df, sheet_name, output_dir, compression, compression_level
+    )
+    return table_name, parquet_path, metadata
+
 
 class ExcelToParquetConverter:
     """
@@ -18,22 +238,43 @@ class ExcelToParquetConverter:
     and relationship inference for KumoRFM.
     """
     
-    def __init__(self, output_dir: str = "uploaded_data"):
+    def __init__(self, output_dir: str = "uploaded_data", compression: str = "zstd",
+                 compression_level: Optional[int] = 1, verbose: bool = True):
         """
         Initialize the converter.
         
         Args:
             output_dir: Directory to save converted Parquet files
+            compression: Parquet codec ("zstd" for compact files, "snappy"
+                for the fastest writes)
+            compression_level: Codec level (ignored by codecs without levels);
+                zstd level 1 writes markedly faster than the default 3 for
+                a slightly larger file
+            verbose: Print progress reports to stdout
         """
         self.output_dir = output_dir
+        self.compression = compression
+        self.compression_level = compression_level if compression in ("zstd", "gzip", "brotli") else None
+        self.verbose = verbose
         self.tables = {}
+        # Footer metadata the writer produced for each table: validation
+        # checks shapes and schema analysis reads null counts from it
+        # without reopening the files
+        self._parquet_metadata = {}
         self.schema_info = {}
         self.relationships = []
+        self._metadata_built = False
         
         # Create output directory if it doesn't exist
         os.makedirs(self.output_dir, exist_ok=True)
     
-    def convert_excel_to_parquet(self, excel_file_path: str) -> Dict[str, pd.DataFrame]:
+    def _flush_log(self, log: io.StringIO) -> None:
+        """Write a buffered progress report with a single write call."""
+        if self.verbose:
+            sys.stdout.write(log.getvalue())
+            sys.stdout.flush()
+    
+    def convert_excel_to_parquet(self, excel_file_path: str) -> Dict[str, "pd.DataFrame"]:
         """
         Convert all sheets in an Excel file to Parquet format.
         
@@ -43,56 +284,118 @@ class ExcelToParquetConverter:
         Returns:
             Dictionary mapping table names to DataFrames
         """
-        print("\n" + "="*80)
-        print("EXCEL TO PARQUET CONVERSION")
-        print("="*80)
-        print(f"Source file: {excel_file_path}")
+        import pandas as pd
         
-        # Load Excel file and get all sheet names
-        excel_file = pd.ExcelFile(excel_file_path)
-        sheet_names = excel_file.sheet_names
+        # Buffer the report and emit it in one write instead of one per line
+        log = io.StringIO()
+        print("\n" + "="*80, file=log)
+        print("EXCEL TO PARQUET CONVERSION", file=log)
+        print("="*80, file=log)
+        print(f"Source file: {excel_file_path}", file=log)
         
-        print(f"Found {len(sheet_names)} sheets: {sheet_names}")
-        print()
-        
-        # Convert each sheet
-        for sheet_name in sheet_names:
-            print(f"Processing sheet: {sheet_name}")
+        # Load Excel file and get all sheet names. Without calamine, pandas'
+        # openpyxl reader opens the workbook with read_only=True,
+        # data_only=True and keep_links=False, streaming rows instead of
+        # building the full cell tree; a read-only workbook holds its file
+        # handle until closed, so the ExcelFile is used as a context manager.
+        with pd.ExcelFile(excel_file_path, engine=_excel_engine()) as excel_file:
+            sheet_names = excel_file.sheet_names
             
-            # Read sheet into DataFrame
-            df = pd.read_excel(excel_file, sheet_name=sheet_name)
+            print(f"Found {len(sheet_names)} sheets: {sheet_names}", file=log)
+            print(file=log)
             
-            # Clean table name (remove _fact suffix if present, make lowercase)
-            table_name = sheet_name.replace('_fact', '').lower()
+            # Large workbooks are parsed and encoded on a process pool, one
+            # workbook handle per worker, since XML parsing and type inference
+            # hold the GIL. Small workbooks, or a single sheet or CPU, reuse
+            # the open handle in-process instead of paying for worker startup.
+            max_workers = min(len(sheet_names), os.cpu_count() or 1)
+            if os.path.getsize(excel_file_path) < _PARALLEL_MIN_BYTES:
+                max_workers = 1
+            if max_workers <= 1:
+                results = [
+                    _write_sheet(
+                        _parse_sheet(excel_file, sheet_name), sheet_name,
+                        self.output_dir, self.compression, self.compression_level
+                    )
+                    for sheet_name in sheet_names
+                ]
+        
+        if max_workers > 1:
+            # Workers are spawned, not forked: the converter runs inside the
+            # threaded Gradio server, and a forked child can inherit locks
+            # held by other threads. Each worker writes its Parquet file and
+            # the parent reads the columnar file back, which is cheaper than
+            # unpickling the frame
+            import pyarrow.parquet as pq
             
-            # Store DataFrame
+            n = len(sheet_names)
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            ) as executor:
+                written = list(executor.map(
+                    _convert_one_sheet,
+                    [excel_file_path] * n, sheet_names, [self.output_dir] * n,
+                    [self.compression] * n, [self.compression_level] * n
+                ))
+            results = [
+                (table_name, pq.read_table(parquet_path).to_pandas(), parquet_path, metadata)
+                for table_name, parquet_path, metadata in written
+            ]
+        
+        # Store tables and report in sheet order
+        for sheet_name, (table_name, df, parquet_path, metadata) in zip(sheet_names, results):
+            print(f"Processing sheet: {sheet_name}", file=log)
             self.tables[table_name] = df
-            
-            # Save as Parquet
-            parquet_path = os.path.join(self.output_dir, f"{table_name}.parquet")
-            df.to_parquet(parquet_path, index=False)
-            
-            print(f"  ✓ Converted to: {parquet_path}")
-            print(f"  ✓ Shape: {df.shape[0]} rows × {df.shape[1]} columns")
+            self._parquet_metadata[table_name] = metadata
+            print(f"  ✓ Converted to: {parquet_path}", file=log)
+            print(f"  ✓ Shape: {df.shape[0]} rows × {df.shape[1]} columns", file=log)
         
-        print(f"\n✅ Successfully converted {len(self.tables)} sheets to Parquet")
+        self._metadata_built = False
+        
+        print(f"\n✅ Successfully converted {len(self.tables)} sheets to Parquet", file=log)
+        self._flush_log(log)
         return self.tables
     
-    def analyze_schema(self) -> Dict:
+    def _build_metadata(self) -> None:
         """
-        Analyze schema of all tables and detect primary keys, foreign keys,
-        and temporal columns.
+        Scan every table once, detecting primary keys, foreign keys and
+        temporal columns and resolving each foreign key to its target table.
         
-        Returns:
-            Schema information dictionary
+        Runs once per conversion; analyze_schema and infer_relationships
+        both read its results.
         """
-        print("\n" + "="*80)
-        print("SCHEMA ANALYSIS")
-        print("="*80)
+        if self._metadata_built:
+            return
+        
+        log = io.StringIO()
+        print("\n" + "="*80, file=log)
+        print("SCHEMA ANALYSIS", file=log)
+        print("="*80, file=log)
+        
+        self.schema_info = {}
+        self.relationships = []
+        
+        # Map singular/plural variants to table names once; plural names win
+        # over exact matches (customer -> customers, policy -> policies)
+        name_index = {t: t for t in self.tables}
+        for t in self.tables:
+            if t.endswith('ies'):
+                name_index[t[:-3] + 'y'] = t
+        for t in self.tables:
+            if t.endswith('s'):
+                name_index[t[:-1]] = t
+        
+        # Foreign keys are resolved as they are found; the target's primary
+        # key is filled in once every table has been analyzed
+        resolved = []
+        # Key-shaped columns, matched by value overlap when the name does not
+        # resolve to a table
+        key_columns = []
         
         for table_name, df in self.tables.items():
-            print(f"\n📊 Table: {table_name}")
-            print("-" * 80)
+            print(f"\n📊 Table: {table_name}", file=log)
+            print("-" * 80, file=log)
             
             schema = {
                 'name': table_name,
@@ -104,51 +407,138 @@ class ExcelToParquetConverter:
                 'temporal_columns': []
             }
             
+            # Whole-frame reductions: one null pass and one distinct pass
+            # per table instead of two of each per column. Null counts come
+            # from the Parquet footer written during conversion when it
+            # matches the frame, without touching the data
+            num_rows = len(df)
+            null_counts = None
+            metadata = self._parquet_metadata.get(table_name)
+            if metadata is not None:
+                null_counts = _footer_null_counts(metadata, list(df.columns), num_rows)
+            if null_counts is None:
+                null_counts = df.isna().sum()
+            unique_counts = df.nunique()
+            # dtype names repeat across every column of every table; interned,
+            # schema_info holds one string object per distinct dtype
+            dtypes = {c: sys.intern(str(dtype)) for c, dtype in df.dtypes.items()}
+            kinds = {c: dtype.kind for c, dtype in df.dtypes.items()}
+            
+            # Lowercased names and FK target names, computed once per column
+            cols_lc = {c: c.lower() for c in df.columns}
+            fk_target = {c: c.replace('_ID', '').replace('_id', '').lower() for c in df.columns}
+            
             # Analyze each column
             for col in df.columns:
+                col_lc = cols_lc[col]
+                has_id = 'id' in col_lc
+                null_count = int(null_counts[col])
+                unique_count = int(unique_counts[col])
                 col_info = {
-                    'dtype': str(df[col].dtype),
-                    'null_count': int(df[col].isnull().sum()),
-                    'null_percentage': float(df[col].isnull().sum() / len(df) * 100),
-                    'unique_count': int(df[col].nunique()),
-                    'unique_percentage': float(df[col].nunique() / len(df) * 100)
+                    'dtype': dtypes[col],
+                    'null_count': null_count,
+                    'null_percentage': float(null_count / num_rows * 100),
+                    'unique_count': unique_count,
+                    'unique_percentage': float(unique_count / num_rows * 100)
                 }
                 
                 # Detect primary key (unique identifier)
-                if col_info['unique_count'] == len(df) and col_info['null_count'] == 0:
-                    if 'id' in col.lower() or 'number' in col.lower():
+                if unique_count == num_rows and null_count == 0:
+                    if has_id or 'number' in col_lc:
                         schema['primary_key'] = col
                         col_info['is_primary_key'] = True
-                        print(f"  🔑 Primary Key detected: {col}")
+                        print(f"  🔑 Primary Key detected: {col}", file=log)
+                
+                if has_id or 'number' in col_lc:
+                    key_columns.append((table_name, col))
                 
                 # Detect foreign keys (references to other tables)
-                if 'id' in col.lower() and col != schema['primary_key']:
+                if has_id and col != schema['primary_key']:
                     # Check if this might reference another table
-                    potential_ref_table = col.replace('_ID', '').replace('_id', '').lower()
+                    potential_ref_table = fk_target[col]
                     if potential_ref_table in self.tables or potential_ref_table.replace('customer', 'customers') in self.tables:
                         schema['foreign_keys'].append(col)
                         col_info['is_foreign_key'] = True
-                        print(f"  🔗 Foreign Key detected: {col}")
+                        print(f"  🔗 Foreign Key detected: {col}", file=log)
+                        
+                        # e.g., customer_ID -> customers, policy_ID -> policies
+                        target_table = name_index.get(potential_ref_table)
+                        if target_table is not None:
+                            resolved.append((table_name, col, target_table))
                 
                 # Detect temporal columns
-                if pd.api.types.is_datetime64_any_dtype(df[col]):
+                if kinds[col] == 'M':
                     schema['temporal_columns'].append(col)
                     col_info['is_temporal'] = True
-                    print(f"  📅 Temporal column detected: {col}")
+                    print(f"  📅 Temporal column detected: {col}", file=log)
                 
                 schema['columns'][col] = col_info
             
             # If no primary key detected, try to infer one
             if not schema['primary_key']:
                 for col in df.columns:
-                    if df[col].nunique() == len(df) and df[col].notnull().all():
+                    if unique_counts[col] == num_rows and null_counts[col] == 0:
                         schema['primary_key'] = col
-                        print(f"  🔑 Inferred Primary Key: {col}")
+                        print(f"  🔑 Inferred Primary Key: {col}", file=log)
                         break
             
             self.schema_info[table_name] = schema
         
-        print("\n✅ Schema analysis complete")
+        # Match the remaining key-shaped columns against every other table's
+        # primary key values (e.g. policy_number -> policies.policy_ID). Only
+        # text keys are matched: small integer ranges overlap by coincidence.
+        # Distinct values are converted to Arrow arrays once per column and
+        # compared with Arrow's hash-set is_in kernel, which is far faster
+        # than Index.isin on string keys.
+        pk_values = {
+            t: _key_values(self.tables[t][schema['primary_key']])
+            for t, schema in self.schema_info.items() if schema['primary_key']
+        }
+        for table_name, col in key_columns:
+            schema = self.schema_info[table_name]
+            if col == schema['primary_key'] or col in schema['foreign_keys']:
+                continue
+            values = _key_values(self.tables[table_name][col])
+            if values[0].empty or values[0].dtype.kind in 'iufb':
+                continue
+            
+            best_table, best_overlap = None, _FK_MIN_OVERLAP
+            for target_table, keys in pk_values.items():
+                if target_table == table_name or keys[0].dtype.kind != values[0].dtype.kind:
+                    continue
+                overlap = _overlap(values, keys)
+                if overlap > best_overlap:
+                    best_table, best_overlap = target_table, overlap
+            
+            if best_table is not None:
+                schema['foreign_keys'].append(col)
+                schema['columns'][col]['is_foreign_key'] = True
+                resolved.append((table_name, col, best_table))
+                print(f"  🔗 Foreign Key detected by value overlap: {table_name}.{col} → {best_table}", file=log)
+        
+        self.relationships = [
+            {
+                'src_table': table_name,
+                'fkey': fkey,
+                'dst_table': target_table,
+                'dst_key': self.schema_info[target_table]['primary_key']
+            }
+            for table_name, fkey, target_table in resolved
+        ]
+        self._metadata_built = True
+        
+        print("\n✅ Schema analysis complete", file=log)
+        self._flush_log(log)
+    
+    def analyze_schema(self) -> Dict:
+        """
+        Analyze schema of all tables and detect primary keys, foreign keys,
+        and temporal columns.
+        
+        Returns:
+            Schema information dictionary
+        """
+        self._build_metadata()
         return self.schema_info
     
     def infer_relationships(self) -> List[Dict]:
@@ -158,43 +548,23 @@ class ExcelToParquetConverter:
         Returns:
             List of relationship dictionaries
         """
-        print("\n" + "="*80)
-        print("RELATIONSHIP INFERENCE")
-        print("="*80)
+        self._build_metadata()
         
-        self.relationships = []
+        log = io.StringIO()
+        print("\n" + "="*80, file=log)
+        print("RELATIONSHIP INFERENCE", file=log)
+        print("="*80, file=log)
         
-        for table_name, schema in self.schema_info.items():
-            for fkey in schema['foreign_keys']:
-                # Infer target table from foreign key name
-                # e.g., customer_ID -> customer, policy_ID -> policy
-                target_table = fkey.replace('_ID', '').replace('_id', '').lower()
-                
-                # Handle plural forms
-                if target_table + 's' in self.schema_info:
-                    target_table = target_table + 's'
-                elif target_table.endswith('y'):
-                    # e.g., policy -> policies
-                    plural = target_table[:-1] + 'ies'
-                    if plural in self.schema_info:
-                        target_table = plural
-                
-                # Check if target table exists
-                if target_table in self.schema_info:
-                    relationship = {
-                        'src_table': table_name,
-                        'fkey': fkey,
-                        'dst_table': target_table,
-                        'dst_key': self.schema_info[target_table]['primary_key']
-                    }
-                    self.relationships.append(relationship)
-                    print(f"  🔗 {table_name}.{fkey} → {target_table}.{relationship['dst_key']}")
+        for relationship in self.relationships:
+            print(f"  🔗 {relationship['src_table']}.{relationship['fkey']} → "
+                  f"{relationship['dst_table']}.{relationship['dst_key']}", file=log)
         
         if not self.relationships:
-            print("  ⚠️  No relationships automatically inferred")
-            print("  💡 You may need to manually define relationships in the UI")
+            print("  ⚠️  No relationships automatically inferred", file=log)
+            print("  💡 You may need to manually define relationships in the UI", file=log)
         else:
-            print(f"\n✅ Inferred {len(self.relationships)} relationships")
+            print(f"\n✅ Inferred {len(self.relationships)} relationships", file=log)
+        self._flush_log(log)
         
         return self.relationships
     
@@ -216,10 +586,15 @@ class ExcelToParquetConverter:
         }
         
         output_path = os.path.join(self.output_dir, output_file)
-        with open(output_path, 'w') as f:
-            json.dump(metadata, f, indent=2, default=str)
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(
+                metadata,
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+            ))
         
-        print(f"\n✅ Metadata exported to: {output_path}")
+        if self.verbose:
+            print(f"\n✅ Metadata exported to: {output_path}")
         return output_path
     
     def get_conversion_summary(self) -> Dict:
@@ -229,11 +604,26 @@ class ExcelToParquetConverter:
         Returns:
             Summary dictionary
         """
+        # Prefer the shapes recorded during analysis, then the in-memory
+        # tables, then the Parquet footers in the output directory
+        if self._metadata_built:
+            shapes = {name: (schema['row_count'], schema['column_count'])
+                      for name, schema in self.schema_info.items()}
+        elif self.tables:
+            shapes = {name: df.shape for name, df in self.tables.items()}
+        else:
+            import pyarrow.parquet as pq
+            
+            shapes = {}
+            for path in sorted(Path(self.output_dir).glob("*.parquet")):
+                metadata = pq.read_metadata(path)
+                shapes[path.stem] = (metadata.num_rows, metadata.num_columns)
+        
         summary = {
-            'num_tables': len(self.tables),
-            'table_names': list(self.tables.keys()),
-            'total_rows': sum(len(df) for df in self.tables.values()),
-            'total_columns': sum(len(df.columns) for df in self.tables.values()),
+            'num_tables': len(shapes),
+            'table_names': list(shapes.keys()),
+            'total_rows': sum(rows for rows, _ in shapes.values()),
+            'total_columns': sum(cols for _, cols in shapes.values()),
             'num_relationships': len(self.relationships),
             'output_directory': self.output_dir
         }
@@ -247,36 +637,50 @@ class ExcelToParquetConverter:
         Returns:
             True if validation passes, False otherwise
         """
-        print("\n" + "="*80)
-        print("VALIDATION")
-        print("="*80)
+        import pyarrow.parquet as pq
         
-        all_valid = True
+        log = io.StringIO()
+        print("\n" + "="*80, file=log)
+        print("VALIDATION", file=log)
+        print("="*80, file=log)
         
-        for table_name, df in self.tables.items():
+        def validate_one(item):
+            table_name, df = item
             parquet_path = os.path.join(self.output_dir, f"{table_name}.parquet")
             
             if not os.path.exists(parquet_path):
-                print(f"  ❌ Missing Parquet file: {parquet_path}")
-                all_valid = False
-                continue
+                return False, f"  ❌ Missing Parquet file: {parquet_path}"
             
-            # Try to read back the Parquet file
-            try:
-                df_check = pd.read_parquet(parquet_path)
-                if len(df_check) == len(df) and len(df_check.columns) == len(df.columns):
-                    print(f"  ✓ {table_name}: Valid ({len(df)} rows, {len(df.columns)} columns)")
-                else:
-                    print(f"  ❌ {table_name}: Shape mismatch")
-                    all_valid = False
-            except Exception as e:
-                print(f"  ❌ {table_name}: Error reading Parquet - {e}")
-                all_valid = False
+            # Shapes are checked against the footer the writer produced;
+            # only tables converted elsewhere have theirs read back, which
+            # still needs no column data
+            metadata = self._parquet_metadata.get(table_name)
+            if metadata is None:
+                try:
+                    metadata = pq.ParquetFile(parquet_path).metadata
+                except Exception as e:
+                    return False, f"  ❌ {table_name}: Error reading Parquet - {e}"
+            if metadata.num_rows == len(df) and metadata.num_columns == len(df.columns):
+                return True, f"  ✓ {table_name}: Valid ({len(df)} rows, {len(df.columns)} columns)"
+            return False, f"  ❌ {table_name}: Shape mismatch"
+        
+        # Any footer reads are independent per file, so they overlap on a
+        # pool; results are reported in table order
+        results = []
+        if self.tables:
+            max_workers = min(len(self.tables), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(validate_one, self.tables.items()))
+        
+        for _, message in results:
+            print(message, file=log)
+        all_valid = all(ok for ok, _ in results)
         
         if all_valid:
-            print("\n✅ All tables validated successfully")
+            print("\n✅ All tables validated successfully", file=log)
         else:
-            print("\n❌ Validation failed for some tables")
+            print("\n❌ Validation failed for some tables", file=log)
+        self._flush_log(log)
         
         return all_valid
 
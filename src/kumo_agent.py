@@ -3,13 +3,93 @@ KumoRFM Conversational Agent Module
 Gradio-based UI for natural language queries to KumoRFM predictions.
 """
 
+import asyncio
+import logging
 import os
-import json
+import re
+import threading
+import time
+import numpy as np
+import orjson
 import pandas as pd
 import gradio as gr
 from typing import Dict, List, Tuple, Any, Optional
 from datetime import datetime
 
+from .kumo_setup import schema_json_default
+
+
+logger = logging.getLogger(__name__)
+
+# Embedding model used to match paraphrased questions in the translation cache
+SEMANTIC_CACHE_MODEL = "text-embedding-3-small"
+# Seconds an embedding request may take before the semantic cache is skipped
+# and the question goes straight to translation (no retries)
+SEMANTIC_CACHE_TIMEOUT = 2.0
+
+# Freshly validated translations at or above this confidence skip
+# re-validation in the chat path
+VALIDATION_CONFIDENCE_THRESHOLD = 0.8
+
+# Default Direct PQL query and the PQL Quick Reference examples, validated
+# once when the agent is created
+DEFAULT_DIRECT_PQL = "PREDICT claims.fraud_flag FOR EACH claims.claim_id"
+REFERENCE_PQL_EXAMPLES = [
+    "PREDICT claims.fraud_flag FOR claims.claim_id=12345",
+    "PREDICT COUNT(claims.*, 0, 30, days) FOR customers.customer_id=100",
+    "PREDICT SUM(claims.claim_amount, 0, 90, days) FOR EACH customers.customer_id",
+]
+
+# Static interface text, built once at import
+_HEADER_MD = """
+# 🏥 KumoRFM Insurance Claims AI Agent
+
+**FraudAGENT**: Natural language interface for insurance claims fraud detection and analysis.
+
+Ask questions in plain English, and the AI will translate them to PQL queries and execute predictions.
+"""
+
+_PQL_REFERENCE_MD = """
+### PQL Quick Reference
+
+**Basic Syntax**:
+- `PREDICT <target> FOR <entity>`
+- `PREDICT COUNT(table.*, start, end, unit) FOR EACH <entity>`
+- `PREDICT SUM/AVG/MIN/MAX(table.column, start, end, unit) FOR <entity>`
+
+**Examples**:
+""" + "\n".join(f"- `{pql}`" for pql in REFERENCE_PQL_EXAMPLES) + "\n"
+
+_ABOUT_MD = """
+### About
+
+**FraudAGENT** - KumoRFM Insurance Claims AI Agent
+
+This application combines:
+- **KumoRFM**: Relational Foundation Model for predictive analytics
+- **OpenAI GPT**: Natural language understanding and PQL translation
+- **Gradio**: Interactive web interface
+
+Built for insurance claims fraud detection, risk assessment, and predictive analytics.
+"""
+
+# Chat tab example questions
+_EXAMPLE_QUERIES = [
+    "Is claim 12345 fraudulent?",
+    "How many claims will customer 100 file in the next 30 days?",
+    "What is the total claim amount for customer 200 in next 90 days?",
+    "Will claim 500 be approved?",
+    "Predict fraud probability for all claims",
+    "Which customers are high risk in the next 60 days?",
+]
+
+
+def _cacheable(translation_result: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of a translation for the agent's caches, without the fresh-validation mark."""
+    result = dict(translation_result)
+    result.pop("validated", None)
+    return result
+
 
 class KumoConversationAgent:
     """
@@ -17,7 +97,15 @@ class KumoConversationAgent:
     Orchestrates NL → PQL translation and query execution.
     """
     
-    def __init__(self, kumo_client, translator, graph_schema: Dict[str, Any]):
+    def __init__(
+        self,
+        kumo_client,
+        translator,
+        graph_schema: Dict[str, Any],
+        semantic_cache_threshold: float = 0.92,
+        semantic_cache_ttl_hours: float = 24.0,
+        semantic_cache_max_entries: int = 512
+    ):
         """
         Initialize conversation agent.
         
@@ -25,13 +113,200 @@ class KumoConversationAgent:
             kumo_client: KumoSetup instance with materialized model
             translator: TextToPQLTranslator instance
             graph_schema: Graph schema dictionary
+            semantic_cache_threshold: Cosine similarity at which a previous
+                question's translation is reused
+            semantic_cache_ttl_hours: Age after which cached translations expire
+            semantic_cache_max_entries: Number of paraphrase entries kept; the
+                oldest entry is overwritten once the cache is full
         """
         self.kumo_client = kumo_client
         self.translator = translator
         self.graph_schema = graph_schema
-        self.query_history = []
+        # Query history, stored column-wise so refreshes build the DataFrame
+        # straight from the column lists; timestamps are epoch nanoseconds
+        self.query_history = {"timestamp": [], "pql_query": [], "anchor_time": [], "num_results": []}
+        self._history_lock = threading.Lock()
         self.current_pql = None
         self.current_result = None
+        
+        # Semantic translation cache: a ring buffer of normalized question
+        # embeddings (one row per entry, allocated on first insert) with the
+        # numbers in each question, its translation and the time it was stored
+        self.semantic_cache_threshold = semantic_cache_threshold
+        self.semantic_cache_ttl = semantic_cache_ttl_hours * 3600
+        self.semantic_cache_max_entries = semantic_cache_max_entries
+        self._sem_vectors = None
+        self._sem_numbers = [None] * semantic_cache_max_entries
+        self._sem_results = [None] * semantic_cache_max_entries
+        self._sem_times = np.full(semantic_cache_max_entries, -np.inf)
+        self._sem_size = 0  # Filled rows
+        self._sem_next = 0  # Row the next entry is written to
+        self._sem_lock = threading.Lock()
+        
+        # Translations of the UI's fixed example questions, keyed by question
+        self._example_cache = {}
+        
+        # Validation results for the Direct PQL tab's canned queries
+        self._validation_cache: Dict[str, Tuple[bool, str]] = {}
+        for pql in (DEFAULT_DIRECT_PQL, *REFERENCE_PQL_EXAMPLES):
+            self._validation_cache[pql] = self.translator.validate_pql(pql)
+    
+    def _embed(self, text: str) -> Optional[np.ndarray]:
+        """
+        Embed a question for the semantic cache.
+        
+        Returns:
+            L2-normalized embedding, or None if the translator has no OpenAI
+            client or the embedding request fails or times out
+        """
+        client = getattr(self.translator, "client", None)
+        if client is None:
+            return None
+        try:
+            response = client.with_options(
+                timeout=SEMANTIC_CACHE_TIMEOUT, max_retries=0
+            ).embeddings.create(model=SEMANTIC_CACHE_MODEL, input=text)
+        except Exception as e:
+            logger.warning("⚠️  Semantic cache disabled for this query: %s", e)
+            return None
+        vector = np.asarray(response.data[0].embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else None
+    
+    def _translate(self, user_message: str) -> Dict[str, Any]:
+        """
+        Translate a question to PQL, reusing the translation of a previous
+        paraphrase of it when one is cached.
+        
+        Exact repeats are answered from the example and translation caches
+        first; the question is only embedded when both miss. A cached entry
+        matches when its embedding is within the similarity threshold and the
+        question mentions the same numbers, so "claim 12345" never reuses the
+        PQL generated for "claim 12346".
+        
+        Args:
+            user_message: User's natural language query
+        
+        Returns:
+            Translation result dictionary
+        """
+        cached = self._example_cache.get(user_message)
+        if cached is not None:
+            return dict(cached)
+        cached = self.translator.cached_translation(user_message)
+        if cached is not None:
+            return cached
+        
+        embedding = self._embed(user_message)
+        numbers = tuple(re.findall(r"\d+(?:\.\d+)?", user_message))
+        
+        if embedding is not None:
+            with self._sem_lock:
+                n = self._sem_size
+                if n:
+                    similarities = self._sem_vectors[:n] @ embedding
+                    # Expired entries never match; they are overwritten in turn
+                    cutoff = time.time() - self.semantic_cache_ttl
+                    similarities[self._sem_times[:n] < cutoff] = -np.inf
+                    for i in np.argsort(similarities)[::-1]:
+                        if similarities[i] < self.semantic_cache_threshold:
+                            break
+                        if self._sem_numbers[i] == numbers:
+                            logger.info("✓ Semantic cache hit (similarity %.2f)", similarities[i])
+                            return dict(self._sem_results[i])
+        
+        translation_result = self.translator.translate(user_message)
+        
+        # Only successful translations are worth reusing
+        if (embedding is not None and translation_result.get("pql_query")
+                and not translation_result.get("requires_clarification")):
+            with self._sem_lock:
+                if self._sem_vectors is None:
+                    self._sem_vectors = np.empty(
+                        (self.semantic_cache_max_entries, embedding.shape[0]), dtype=np.float32
+                    )
+                i = self._sem_next
+                self._sem_vectors[i] = embedding
+                self._sem_numbers[i] = numbers
+                self._sem_results[i] = _cacheable(translation_result)
+                self._sem_times[i] = time.time()
+                self._sem_next = (i + 1) % self.semantic_cache_max_entries
+                self._sem_size = min(self._sem_size + 1, self.semantic_cache_max_entries)
+        
+        return translation_result
+    
+    def validate_pql(self, pql_query: str) -> Tuple[bool, str]:
+        """
+        Validate a PQL query, answering the canned example queries from the
+        results computed at startup.
+        
+        Args:
+            pql_query: PQL query string to validate
+        
+        Returns:
+            Tuple of (is_valid, message)
+        """
+        cached = self._validation_cache.get(pql_query)
+        if cached is not None:
+            return cached
+        return self.translator.validate_pql(pql_query)
+    
+    def _check_translation(
+        self,
+        pql_query: str,
+        translation_result: Dict[str, Any]
+    ) -> Tuple[bool, str]:
+        """
+        Validate a translated query unless that is already done.
+        
+        translate() validates fresh output against the current schema, halves
+        the confidence of invalid queries and marks the result "validated";
+        those confident results are accepted as they are. Cached results
+        carry no mark and are validated again.
+        
+        Returns:
+            Tuple of (is_valid, message)
+        """
+        if (translation_result.get("validated")
+                and translation_result.get("confidence", 0) >= VALIDATION_CONFIDENCE_THRESHOLD):
+            return True, ""
+        return self.validate_pql(pql_query)
+    
+    def warm_example_cache(self, questions: List[str]) -> None:
+        """
+        Translate the UI's example questions ahead of time so clicking one
+        does not wait on the LLM.
+        
+        Args:
+            questions: Example questions shown in the interface
+        """
+        for question in questions:
+            if question in self._example_cache:
+                continue
+            try:
+                translation_result = self.translator.translate(question)
+            except Exception as e:
+                logger.warning("⚠️  Could not pre-translate example '%s': %s", question, e)
+                continue
+            if translation_result.get("pql_query") and not translation_result.get("requires_clarification"):
+                self._example_cache[question] = _cacheable(translation_result)
+    
+    @staticmethod
+    def _format_translation_response(
+        pql_query: str,
+        confidence: float,
+        explanation: str,
+        is_valid: bool,
+        validation_msg: str
+    ) -> str:
+        """Format the chat reply for a generated PQL query."""
+        warning = f"⚠️ **Validation Warning**: {validation_msg}\n\n" if not is_valid else ""
+        return (
+            f"**Generated PQL Query** (confidence: {confidence:.0%}):\n```\n{pql_query}\n```\n\n"
+            f"**Explanation**: {explanation}\n\n"
+            f"{warning}"
+            "Click **Execute Query** to run this prediction."
+        )
     
     def process_message(
         self, 
@@ -48,14 +323,16 @@ class KumoConversationAgent:
         Returns:
             Tuple of (updated_chat_history, pql_code, result_dataframe, plot_json)
         """
-        if not user_message.strip():
+        # Strip once; the trimmed message is what gets translated and cached
+        user_message = (user_message or "").strip()
+        if not user_message:
             return chat_history, "", None, ""
         
         # Add user message to history
         chat_history.append((user_message, None))
         
         # Translate to PQL
-        translation_result = self.translator.translate(user_message)
+        translation_result = self._translate(user_message)
         
         # Check if clarification needed
         if translation_result.get("requires_clarification"):
@@ -75,17 +352,13 @@ class KumoConversationAgent:
         # Store current PQL
         self.current_pql = pql_query
         
-        # Validate PQL
-        is_valid, validation_msg = self.translator.validate_pql(pql_query)
+        # Validate PQL unless translate() just validated it
+        is_valid, validation_msg = self._check_translation(pql_query, translation_result)
         
         # Generate response
-        response = f"**Generated PQL Query** (confidence: {confidence:.0%}):\n```\n{pql_query}\n```\n\n"
-        response += f"**Explanation**: {explanation}\n\n"
-        
-        if not is_valid:
-            response += f"⚠️ **Validation Warning**: {validation_msg}\n\n"
-        
-        response += "Click **Execute Query** to run this prediction."
+        response = self._format_translation_response(
+            pql_query, confidence, explanation, is_valid, validation_msg
+        )
         
         chat_history[-1] = (user_message, response)
         
@@ -106,13 +379,15 @@ class KumoConversationAgent:
         Returns:
             Tuple of (result_dataframe, status_message, plot_json)
         """
-        if not pql_query or not pql_query.strip():
+        pql_query = (pql_query or "").strip()
+        if not pql_query:
             return None, "❌ No PQL query to execute", ""
         
         try:
             # Parse anchor time if provided
             anchor_time = None
-            if anchor_time_str and anchor_time_str.strip():
+            anchor_time_str = (anchor_time_str or "").strip()
+            if anchor_time_str:
                 try:
                     anchor_time = pd.Timestamp(anchor_time_str)
                 except Exception as e:
@@ -122,25 +397,32 @@ class KumoConversationAgent:
             print(f"\n🚀 Executing PQL: {pql_query}")
             result_df = self.kumo_client.execute_pql(pql_query, anchor_time=anchor_time)
             
-            # Store result
-            self.current_result = result_df
+            n_rows, n_cols = result_df.shape
+            executed_ns = time.time_ns()
             
             # Add to history
-            self.query_history.append({
-                "timestamp": datetime.now().isoformat(),
-                "pql_query": pql_query,
-                "anchor_time": str(anchor_time) if anchor_time else None,
-                "num_results": len(result_df)
-            })
+            with self._history_lock:
+                self.query_history["timestamp"].append(executed_ns)
+                self.query_history["pql_query"].append(pql_query)
+                self.query_history["anchor_time"].append(str(anchor_time) if anchor_time else None)
+                self.query_history["num_results"].append(n_rows)
             
             # Generate status message
             status = f"✅ Query executed successfully!\n"
-            status += f"📊 Returned {len(result_df)} row(s), {len(result_df.columns)} column(s)\n"
-            status += f"⏱️ Executed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+            status += f"📊 Returned {n_rows} row(s), {n_cols} column(s)\n"
+            status += f"⏱️ Executed at: {datetime.fromtimestamp(executed_ns / 1e9):%Y-%m-%d %H:%M:%S}"
             
             # Generate simple plot data (if applicable)
             plot_json = self._generate_plot(result_df)
             
+            # Hand Gradio Arrow-backed columns: strings are stored compactly
+            # and missing values render as empty cells rather than NaN/epoch
+            if not result_df.empty:
+                result_df = result_df.convert_dtypes(dtype_backend="pyarrow")
+            
+            # Store result
+            self.current_result = result_df
+            
             return result_df, status, plot_json
             
         except Exception as e:
@@ -151,6 +433,26 @@ class KumoConversationAgent:
             error_msg += "- Ensure temporal columns are properly configured"
             return None, error_msg, ""
     
+    async def execute_query_async(
+        self,
+        pql_query: str,
+        anchor_time_str: Optional[str] = None
+    ) -> Tuple[Optional[pd.DataFrame], str, str]:
+        """
+        Execute PQL query without blocking the event loop.
+        
+        Runs execute_query in a worker thread so Gradio's event loop keeps
+        serving other sessions during the KumoRFM call.
+        
+        Args:
+            pql_query: PQL query string
+            anchor_time_str: Optional anchor time string (YYYY-MM-DD)
+        
+        Returns:
+            Tuple of (result_dataframe, status_message, plot_json)
+        """
+        return await asyncio.to_thread(self.execute_query, pql_query, anchor_time_str)
+    
     def _generate_plot(self, df: pd.DataFrame) -> str:
         """
         Generate plot data from result DataFrame.
@@ -166,17 +468,35 @@ class KumoConversationAgent:
             return ""
         
         # Check for common result patterns
-        prob_cols = [col for col in df.columns if 'PROB' in col.upper()]
+        prob_mask = df.columns.astype(str).str.contains('PROB', case=False, regex=False)
+        prob_cols = df.columns[prob_mask].tolist()
         
         if prob_cols and len(df) <= 20:
+            # First column as x-axis: string columns are used as-is and
+            # numeric IDs are cast on the NumPy array; anything else (e.g.
+            # timestamps) keeps pandas' string formatting
+            x_col = df.iloc[:, 0]
+            if pd.api.types.is_string_dtype(x_col) and not x_col.hasnans:
+                x_values = x_col.to_numpy().tolist()
+            elif isinstance(x_col.dtype, np.dtype) and x_col.dtype.kind in "iufb":
+                x_values = x_col.to_numpy().astype(str).tolist()
+            else:
+                x_values = x_col.astype(str).tolist()
+            
             # Create simple bar chart data
             plot_data = {
                 "type": "bar",
-                "x": df.iloc[:, 0].astype(str).tolist(),  # First column as x-axis
-                "y": df[prob_cols[0]].tolist(),  # First probability column
+                "x": x_values,
+                "y": df[prob_cols[0]].to_numpy(),  # First probability column
                 "title": f"Prediction Results: {prob_cols[0]}"
             }
-            return json.dumps(plot_data)
+            # orjson serializes the NumPy column directly; object arrays
+            # (e.g. nullable dtypes) fall back to a list
+            return orjson.dumps(
+                plot_data,
+                default=lambda obj: obj.tolist() if isinstance(obj, np.ndarray) else str(obj),
+                option=orjson.OPT_SERIALIZE_NUMPY
+            ).decode()
         
         return ""
     
@@ -187,10 +507,17 @@ class KumoConversationAgent:
         Returns:
             DataFrame with query history
         """
-        if not self.query_history:
-            return pd.DataFrame(columns=["timestamp", "pql_query", "anchor_time", "num_results"])
-        
-        return pd.DataFrame(self.query_history)
+        with self._history_lock:
+            history = pd.DataFrame(self.query_history)
+        
+        # Timestamps are kept as epoch nanoseconds and converted to local
+        # time here, in one vectorized pass
+        history["timestamp"] = (
+            pd.to_datetime(history["timestamp"].astype("int64"), unit="ns", utc=True)
+            .dt.tz_convert(datetime.now().astimezone().tzinfo)
+            .dt.tz_localize(None)
+        )
+        return history
     
     def process_query(self, user_message: str) -> Dict[str, Any]:
         """
@@ -203,20 +530,18 @@ class KumoConversationAgent:
         Returns:
             Dictionary with 'response' and 'pql_query' keys
         """
-        print(f"\n[DEBUG] process_query called with: {user_message}")
+        logger.debug("process_query called with: %s", user_message)
         
-        if not user_message.strip():
+        user_message = (user_message or "").strip()
+        if not user_message:
             return {"response": "Please enter a question.", "pql_query": ""}
         
-        print("[DEBUG] About to call translator.translate()")
         try:
             # Translate to PQL
-            translation_result = self.translator.translate(user_message)
-            print(f"[DEBUG] Translation result: {translation_result}")
-        except Exception as e:
-            print(f"[DEBUG] Error in translator.translate(): {e}")
-            import traceback
-            traceback.print_exc()
+            translation_result = self._translate(user_message)
+            logger.debug("Translation result: %s", translation_result)
+        except Exception:
+            logger.exception("translator.translate() failed for: %s", user_message)
             raise
         
         # Check if clarification needed
@@ -238,17 +563,13 @@ class KumoConversationAgent:
         # Store current PQL
         self.current_pql = pql_query
         
-        # Validate PQL
-        is_valid, validation_msg = self.translator.validate_pql(pql_query)
+        # Validate PQL unless translate() just validated it
+        is_valid, validation_msg = self._check_translation(pql_query, translation_result)
         
         # Generate response
-        response = f"**Generated PQL Query** (confidence: {confidence:.0%}):\n```\n{pql_query}\n```\n\n"
-        response += f"**Explanation**: {explanation}\n\n"
-        
-        if not is_valid:
-            response += f"⚠️ **Validation Warning**: {validation_msg}\n\n"
-        
-        response += "Click **Execute Query** to run this prediction."
+        response = self._format_translation_response(
+            pql_query, confidence, explanation, is_valid, validation_msg
+        )
         
         return {
             "response": response,
@@ -290,13 +611,7 @@ def create_gradio_interface(agent: KumoConversationAgent, graph_schema: Dict[str
     
     with gr.Blocks(title="KumoRFM Insurance Claims AI Agent", theme=gr.themes.Soft()) as app:
         
-        gr.Markdown("""
-        # 🏥 KumoRFM Insurance Claims AI Agent
-        
-        **FraudAGENT**: Natural language interface for insurance claims fraud detection and analysis.
-        
-        Ask questions in plain English, and the AI will translate them to PQL queries and execute predictions.
-        """)
+        gr.Markdown(_HEADER_MD)
         
         with gr.Tabs():
             
@@ -347,24 +662,25 @@ def create_gradio_interface(agent: KumoConversationAgent, graph_schema: Dict[str
                 # Example queries
                 gr.Markdown("### 💡 Example Queries")
                 gr.Examples(
-                    examples=[
-                        ["Is claim 12345 fraudulent?"],
-                        ["How many claims will customer 100 file in the next 30 days?"],
-                        ["What is the total claim amount for customer 200 in next 90 days?"],
-                        ["Will claim 500 be approved?"],
-                        ["Predict fraud probability for all claims"],
-                        ["Which customers are high risk in the next 60 days?"],
-                    ],
+                    examples=[[query] for query in _EXAMPLE_QUERIES],
                     inputs=user_input
                 )
                 
+                # The examples are fixed, so translate them in the background
+                # while the UI starts instead of on first click
+                threading.Thread(
+                    target=agent.warm_example_cache,
+                    args=(_EXAMPLE_QUERIES,),
+                    daemon=True
+                ).start()
+                
                 # Event handlers
                 def send_message(message, history):
                     new_history, pql, result, plot = agent.process_message(message, history)
                     return new_history, pql, None, "Status: PQL generated. Click Execute to run."
                 
-                def execute_pql(pql, anchor_time):
-                    result, status, plot = agent.execute_query(pql, anchor_time)
+                async def execute_pql(pql, anchor_time):
+                    result, status, plot = await agent.execute_query_async(pql, anchor_time)
                     return result, status
                 
                 send_btn.click(
@@ -395,10 +711,13 @@ def create_gradio_interface(agent: KumoConversationAgent, graph_schema: Dict[str
             with gr.Tab("📊 Data Explorer"):
                 gr.Markdown("### Graph Schema and Sample Data")
                 
-                # Display schema
-                schema_json = gr.JSON(
+                # Display schema; it is fixed once the graph is built, so it
+                # is serialized once here rather than by each client render
+                schema_json = gr.Code(
                     label="Graph Schema",
-                    value=graph_schema
+                    value=orjson.dumps(graph_schema, default=schema_json_default, option=orjson.OPT_INDENT_2).decode(),
+                    language="json",
+                    interactive=False
                 )
                 
                 gr.Markdown("### Sample Data")
@@ -413,7 +732,7 @@ def create_gradio_interface(agent: KumoConversationAgent, graph_schema: Dict[str
                     label="PQL Query",
                     language="sql",
                     lines=10,
-                    value="PREDICT claims.fraud_flag FOR EACH claims.claim_id"
+                    value=DEFAULT_DIRECT_PQL
                 )
                 
                 with gr.Row():
@@ -424,14 +743,14 @@ def create_gradio_interface(agent: KumoConversationAgent, graph_schema: Dict[str
                 direct_result = gr.Dataframe(label="Results")
                 
                 def validate_pql(pql):
-                    is_valid, msg = agent.translator.validate_pql(pql)
+                    is_valid, msg = agent.validate_pql(pql)
                     if is_valid:
                         return f"✅ **Valid PQL**: {msg}"
                     else:
                         return f"❌ **Invalid PQL**: {msg}"
                 
-                def execute_direct_pql(pql):
-                    result, status, _ = agent.execute_query(pql)
+                async def execute_direct_pql(pql):
+                    result, status, _ = await agent.execute_query_async(pql)
                     return result, status
                 
                 validate_btn.click(
@@ -447,19 +766,7 @@ def create_gradio_interface(agent: KumoConversationAgent, graph_schema: Dict[str
                 )
                 
                 # PQL Reference
-                gr.Markdown("""
-                ### PQL Quick Reference
-                
-                **Basic Syntax**:
-                - `PREDICT <target> FOR <entity>`
-                - `PREDICT COUNT(table.*, start, end, unit) FOR EACH <entity>`
-                - `PREDICT SUM/AVG/MIN/MAX(table.column, start, end, unit) FOR <entity>`
-                
-                **Examples**:
-                - `PREDICT claims.fraud_flag FOR claims.claim_id=12345`
-                - `PREDICT COUNT(claims.*, 0, 30, days) FOR customers.customer_id=100`
-                - `PREDICT SUM(claims.claim_amount, 0, 90, days) FOR EACH customers.customer_id`
-                """)
+                gr.Markdown(_PQL_REFERENCE_MD)
             
             # ===== TAB 4: Performance =====
             with gr.Tab("📈 Performance"):
@@ -483,32 +790,26 @@ def create_gradio_interface(agent: KumoConversationAgent, graph_schema: Dict[str
             with gr.Tab("⚙️ Settings"):
                 gr.Markdown("### Application Settings")
                 
+                kumo_key_status = '✅ Set' if os.environ.get('KUMO_API_KEY') else '❌ Not Set'
+                openai_key_status = '✅ Set' if os.environ.get('OPENAI_API_KEY') else '❌ Not Set'
+                n_tables = len(graph_schema.get('tables') or ())
+                n_relationships = len(graph_schema.get('relationships') or ())
+                
                 gr.Markdown(f"""
                 **Environment Variables**:
-                - `KUMO_API_KEY`: {'✅ Set' if os.getenv('KUMO_API_KEY') else '❌ Not Set'}
-                - `OPENAI_API_KEY`: {'✅ Set' if os.getenv('OPENAI_API_KEY') else '❌ Not Set'}
+                - `KUMO_API_KEY`: {kumo_key_status}
+                - `OPENAI_API_KEY`: {openai_key_status}
                 
                 **Model Configuration**:
                 - OpenAI Model: {agent.translator.model}
                 - KumoRFM SDK: {agent.kumo_client.sdk_import_method}
                 
                 **Graph Statistics**:
-                - Number of Tables: {len(graph_schema.get('tables', {}))}
-                - Number of Relationships: {len(graph_schema.get('relationships', []))}
+                - Number of Tables: {n_tables}
+                - Number of Relationships: {n_relationships}
                 """)
                 
-                gr.Markdown("""
-                ### About
-                
-                **FraudAGENT** - KumoRFM Insurance Claims AI Agent
-                
-                This application combines:
-                - **KumoRFM**: Relational Foundation Model for predictive analytics
-                - **OpenAI GPT**: Natural language understanding and PQL translation
-                - **Gradio**: Interactive web interface
-                
-                Built for insurance claims fraud detection, risk assessment, and predictive analytics.
-                """)
+                gr.Markdown(_ABOUT_MD)
         
         return app
 
@@ -3,12 +3,50 @@ KumoRFM Setup Module
 Handles KumoRFM client initialization, dataset import, and graph creation.
 """
 
+import importlib
+import importlib.util
+import logging
 import os
 import sys
-import pandas as pd
-from typing import Dict, List, Optional, Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, List, Mapping, Optional, Any
 from pathlib import Path
 
+# pandas is only needed for type hints here; the SDK receives the caller's
+# DataFrames, so importing this module does not load pandas.
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+logger = logging.getLogger(__name__)
+
+
+def _log_banner(title: str) -> None:
+    """Log a section banner, skipping the formatting when INFO is disabled."""
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("\n%s\n%s\n%s", "=" * 80, title, "=" * 80)
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively wrap dicts in read-only mapping proxies and lists in tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def schema_json_default(obj: Any) -> Any:
+    """
+    orjson `default` hook for frozen graph schemas.
+    
+    Read-only mappings serialize as objects; anything else unsupported is
+    stringified.
+    """
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    return str(obj)
+
 
 class KumoSetup:
     """
@@ -22,6 +60,8 @@ class KumoSetup:
         self.graph = None
         self.model = None
         self.sdk_import_method = None
+        # get_graph_schema() result; reset whenever the graph changes
+        self._schema_cache = None
         self._import_sdk()
     
     def _import_sdk(self):
@@ -37,22 +77,24 @@ class KumoSetup:
         ]
         
         for module_name, import_statement in import_attempts:
+            # find_spec checks availability without running module code on a
+            # miss; a dotted name raises if its parent package is absent.
+            # Modules already in sys.modules (e.g. an installed mock SDK) may
+            # have no __spec__, so they skip the check.
+            if module_name not in sys.modules:
+                try:
+                    if importlib.util.find_spec(module_name) is None:
+                        continue
+                except (ModuleNotFoundError, ValueError):
+                    continue
+            
             try:
-                if module_name == "kumoai.experimental.rfm":
-                    import kumoai.experimental.rfm as rfm
-                elif module_name == "kumo_rfm":
-                    import kumo_rfm as rfm
-                elif module_name == "kumorfm":
-                    import kumorfm as rfm
-                elif module_name == "kumoai.rfm":
-                    from kumoai import rfm
-                
-                self.rfm = rfm
-                self.sdk_import_method = import_statement
-                print(f"✓ Successfully imported KumoRFM SDK: {import_statement}")
-                return
+                self.rfm = importlib.import_module(module_name)
             except ImportError:
                 continue
+            self.sdk_import_method = import_statement
+            logger.info("✓ Successfully imported KumoRFM SDK: %s", import_statement)
+            return
         
         # If all attempts fail
         raise ImportError(
@@ -81,14 +123,15 @@ class KumoSetup:
         try:
             # Initialize client with API key
             self.rfm.init(api_key=api_key)
-            print("✓ KumoRFM client authenticated successfully")
+            logger.info("✓ KumoRFM client authenticated successfully")
         except Exception as e:
             raise RuntimeError(f"Failed to authenticate with KumoRFM: {e}")
     
     def import_dataset(
         self, 
-        tables: Dict[str, pd.DataFrame],
-        auto_infer_metadata: bool = True
+        tables: Dict[str, "pd.DataFrame"],
+        auto_infer_metadata: bool = True,
+        chunk_size_mb: Optional[float] = None
     ) -> Dict[str, Any]:
         """
         Import pandas DataFrames into KumoRFM as LocalTables.
@@ -96,39 +139,69 @@ class KumoSetup:
         Args:
             tables: Dictionary mapping table names to pandas DataFrames
             auto_infer_metadata: Whether to automatically infer metadata (PKs, time columns, types)
+            chunk_size_mb: If set, tables larger than this are passed to the SDK
+                in row chunks of about this size, when the SDK's LocalTable
+                supports append(); otherwise they are imported whole
         
         Returns:
             Dictionary mapping table names to LocalTable objects
         """
-        print("\n" + "="*80)
-        print("IMPORTING DATA TO KUMORFM")
-        print("="*80)
+        _log_banner("IMPORTING DATA TO KUMORFM")
         
         local_tables = {}
         
         for table_name, df in tables.items():
-            print(f"\n📥 Importing table: {table_name}")
+            logger.debug("📥 Importing table: %s", table_name)
             
             try:
                 # Create LocalTable
                 # SDK method: rfm.LocalTable(df, name=table_name)
-                local_table = self.rfm.LocalTable(df, name=table_name)
+                local_table = self._create_local_table(df, table_name, chunk_size_mb)
                 
                 if auto_infer_metadata:
                     # Auto-infer metadata (primary keys, time columns, semantic types)
                     local_table = local_table.infer_metadata()
-                    print(f"  ✓ Metadata inferred for '{table_name}'")
+                    logger.debug("  ✓ Metadata inferred for '%s'", table_name)
                 
                 local_tables[table_name] = local_table
-                print(f"  ✓ Table '{table_name}' imported successfully")
+                logger.info("  ✓ Table '%s' imported successfully", table_name)
                 
             except Exception as e:
-                print(f"  ✗ Failed to import '{table_name}': {e}")
+                logger.error("  ✗ Failed to import '%s': %s", table_name, e)
                 raise
         
-        print("\n✓ All tables imported to KumoRFM")
+        logger.info("✓ All tables imported to KumoRFM")
         return local_tables
     
+    def _create_local_table(
+        self,
+        df: "pd.DataFrame",
+        table_name: str,
+        chunk_size_mb: Optional[float] = None
+    ) -> Any:
+        """
+        Create a LocalTable, appending large frames in row chunks if possible.
+        
+        Chunking needs LocalTable.append(); without it the frame is passed
+        whole, as before.
+        """
+        if not chunk_size_mb or len(df) == 0 or not hasattr(self.rfm.LocalTable, 'append'):
+            return self.rfm.LocalTable(df, name=table_name)
+        
+        total_bytes = int(df.memory_usage(index=False, deep=True).sum())
+        chunk_bytes = chunk_size_mb * 1024 * 1024
+        if total_bytes <= chunk_bytes:
+            return self.rfm.LocalTable(df, name=table_name)
+        
+        rows_per_chunk = max(1, int(chunk_bytes / (total_bytes / len(df))))
+        local_table = self.rfm.LocalTable(df.iloc[:rows_per_chunk], name=table_name)
+        n_chunks = 1
+        for start in range(rows_per_chunk, len(df), rows_per_chunk):
+            local_table.append(df.iloc[start:start + rows_per_chunk])
+            n_chunks += 1
+        logger.debug("  ✓ Imported '%s' in %d chunks of up to %d rows", table_name, n_chunks, rows_per_chunk)
+        return local_table
+    
     def create_graph(
         self,
         local_tables: Dict[str, Any],
@@ -147,34 +220,33 @@ class KumoSetup:
         Returns:
             LocalGraph object
         """
-        print("\n" + "="*80)
-        print("CREATING KUMORFM GRAPH")
-        print("="*80)
+        _log_banner("CREATING KUMORFM GRAPH")
         
         try:
             # Create graph from tables
             # SDK method: rfm.LocalGraph(tables=[...])
             table_list = list(local_tables.values())
             self.graph = self.rfm.LocalGraph(tables=table_list)
-            print(f"✓ Graph created with {len(table_list)} tables")
+            self._schema_cache = None
+            logger.info("✓ Graph created with %d tables", len(table_list))
             
             # Auto-infer links if requested
             if auto_infer_links:
-                print("\n🔗 Auto-inferring relationships...")
+                logger.info("🔗 Auto-inferring relationships...")
                 # The SDK may have an auto-link method; if not, we'll need manual linking
                 # Attempt: graph.infer_links() or similar
                 try:
                     if hasattr(self.graph, 'infer_links'):
                         self.graph.infer_links()
-                        print("  ✓ Relationships auto-inferred")
+                        logger.info("  ✓ Relationships auto-inferred")
                     else:
-                        print("  ⚠ Auto-inference not available, use manual links")
+                        logger.warning("  ⚠ Auto-inference not available, use manual links")
                 except Exception as e:
-                    print(f"  ⚠ Auto-inference failed: {e}")
+                    logger.warning("  ⚠ Auto-inference failed: %s", e)
             
             # Add manual links
             if manual_links:
-                print("\n🔗 Adding manual relationships...")
+                logger.info("🔗 Adding manual relationships...")
                 for link in manual_links:
                     src_table = link['src_table']
                     fkey = link['fkey']
@@ -183,18 +255,21 @@ class KumoSetup:
                     try:
                         # SDK method: graph.link(src_table=..., fkey=..., dst_table=...)
                         self.graph.link(src_table=src_table, fkey=fkey, dst_table=dst_table)
-                        print(f"  ✓ Linked: {src_table}.{fkey} → {dst_table}")
+                        self._schema_cache = None
+                        logger.info("  ✓ Linked: %s.%s → %s", src_table, fkey, dst_table)
                     except Exception as e:
-                        print(f"  ✗ Failed to link {src_table}.{fkey} → {dst_table}: {e}")
-            
-            # Print graph metadata
-            print("\n📊 Graph Metadata:")
-            if hasattr(self.graph, 'print_metadata'):
-                self.graph.print_metadata()
+                        logger.error("  ✗ Failed to link %s.%s → %s: %s", src_table, fkey, dst_table, e)
             
-            if hasattr(self.graph, 'print_links'):
-                print("\n🔗 Graph Links:")
-                self.graph.print_links()
+            # Print graph metadata. The SDK prints these reports itself, so
+            # they follow the logger's INFO level explicitly
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("📊 Graph Metadata:")
+                if hasattr(self.graph, 'print_metadata'):
+                    self.graph.print_metadata()
+                
+                if hasattr(self.graph, 'print_links'):
+                    logger.info("🔗 Graph Links:")
+                    self.graph.print_links()
             
             return self.graph
             
@@ -211,29 +286,35 @@ class KumoSetup:
         if self.graph is None:
             raise ValueError("Graph not created. Call create_graph() first.")
         
-        print("\n" + "="*80)
-        print("MATERIALIZING GRAPH")
-        print("="*80)
+        _log_banner("MATERIALIZING GRAPH")
         
         try:
             # SDK method: rfm.KumoRFM(graph)
             self.model = self.rfm.KumoRFM(self.graph)
-            print("✓ Graph materialized, KumoRFM model ready for predictions")
+            logger.info("✓ Graph materialized, KumoRFM model ready for predictions")
             return self.model
             
         except Exception as e:
             raise RuntimeError(f"Failed to materialize graph: {e}")
     
-    def get_graph_schema(self) -> Dict[str, Any]:
+    def get_graph_schema(self) -> Mapping[str, Any]:
         """
         Extract graph schema information for PQL translation.
         
+        The schema is built once per graph and shared between callers, so it
+        is returned read-only: nested dicts are mapping proxies and lists are
+        tuples. create_graph() and manual links invalidate it. Serialize it
+        with orjson using schema_json_default.
+        
         Returns:
-            Dictionary containing graph schema details (tables, columns, relationships)
+            Read-only mapping of graph schema details (tables, columns, relationships)
         """
         if self.graph is None:
             raise ValueError("Graph not created. Call create_graph() first.")
         
+        if self._schema_cache is not None:
+            return self._schema_cache
+        
         schema = {
             "tables": {},
             "relationships": []
@@ -249,14 +330,17 @@ class KumoSetup:
                 "columns": {}
             }
             
-            # Extract column information
-            for col_name in table.df.columns:
-                col_obj = table[col_name] if hasattr(table, '__getitem__') else None
+            # Extract column information. dtypes is read once per table
+            # rather than building a Series per column to get its dtype
+            columns = schema["tables"][table_name]["columns"]
+            has_columns = hasattr(table, '__getitem__')
+            for col_name, dtype in table.df.dtypes.items():
+                col_obj = table[col_name] if has_columns else None
                 stype = getattr(col_obj, 'stype', 'unknown') if col_obj else 'unknown'
                 
-                schema["tables"][table_name]["columns"][col_name] = {
+                columns[col_name] = {
                     "name": col_name,
-                    "dtype": str(table.df[col_name].dtype),
+                    "dtype": str(dtype),
                     "stype": stype
                 }
         
@@ -269,9 +353,10 @@ class KumoSetup:
                     "dst_table": edge.dst_table
                 })
         
-        return schema
+        self._schema_cache = _freeze(schema)
+        return self._schema_cache
     
-    def execute_pql(self, pql_query: str, anchor_time: Optional[pd.Timestamp] = None) -> pd.DataFrame:
+    def execute_pql(self, pql_query: str, anchor_time: Optional["pd.Timestamp"] = None) -> "pd.DataFrame":
         """
         Execute a PQL query and return results.
         
@@ -302,6 +387,7 @@ def main():
     """
     Example usage and testing.
     """
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     print("KumoRFM Setup Module - Test Mode")
     print("="*80)
     
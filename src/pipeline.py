@@ -0,0 +1,291 @@
+"""
+Application Pipeline Module
+Shared startup pipeline (environment validation and Phases 1-4) used by
+main.py and main_with_upload.py.
+"""
+
+import io
+import logging
+import os
+import sys
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+# Phase modules pull in pandas, pyarrow and openai; they are imported inside
+# the phase functions so that environment validation stays cheap.
+if TYPE_CHECKING:
+    from .kumo_setup import KumoSetup
+    from .kumo_agent import KumoConversationAgent
+
+
+UPLOAD_DIR = "uploaded_data"
+DEFAULT_DATA_PATH = "data/insurance_claims_data.parquet"
+
+
+@dataclass(frozen=True)
+class Config:
+    """Application configuration, read from the environment once at startup."""
+
+    openai_model: str
+    app_host: str
+    app_port: int
+    share_ui: bool
+    data_path: str
+
+    @classmethod
+    def from_env(cls, data_path: Optional[str] = None) -> "Config":
+        """
+        Build the configuration from environment variables.
+
+        Args:
+            data_path: Resolved data source (default: INSURANCE_DATA_PATH or
+                the bundled Parquet file)
+
+        Returns:
+            Config instance
+        """
+        if data_path is None:
+            data_path = os.getenv("INSURANCE_DATA_PATH", DEFAULT_DATA_PATH)
+        return cls(
+            openai_model=os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
+            app_host=os.getenv("APP_HOST", "0.0.0.0"),
+            app_port=int(os.getenv("APP_PORT", "7860")),
+            share_ui=os.getenv("GRADIO_SHARE", "false").lower() == "true",
+            data_path=data_path,
+        )
+
+
+def print_phase(title: str, file=None) -> None:
+    """Print a phase banner."""
+    print("\n" + "="*80 + "\n" + title + "\n" + "="*80, file=file)
+
+
+def flush_log(log: io.StringIO) -> None:
+    """Write a buffered block of console output with a single write call."""
+    sys.stdout.write(log.getvalue())
+    sys.stdout.flush()
+
+
+def configure_logging() -> None:
+    """
+    Send module log records to stdout at LOG_LEVEL (default INFO).
+
+    The setup, translator and agent modules log their progress instead of
+    printing it, so this keeps the console output of the entry points.
+    """
+    level = os.getenv("LOG_LEVEL", "INFO").upper()
+    logging.basicConfig(
+        level=getattr(logging, level, logging.INFO),
+        format="%(message)s",
+        stream=sys.stdout,
+    )
+
+
+def has_uploaded_data(upload_dir: str = UPLOAD_DIR) -> bool:
+    """
+    Check whether the upload directory exists and contains at least one entry.
+
+    Hidden entries, such as the upload UI's analysis cache, are not data.
+    Stops at the first data entry instead of listing the whole directory.
+    """
+    try:
+        with os.scandir(upload_dir) as entries:
+            return any(not entry.name.startswith(".") for entry in entries)
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+
+
+def validate_environment(allow_upload: bool = False) -> bool:
+    """
+    Validate required environment variables and dependencies.
+
+    Args:
+        allow_upload: Treat uploaded data as a valid data source (upload-enabled app)
+
+    Returns:
+        True if validation passes, False otherwise
+    """
+    # Buffer the report and emit it in one write instead of one per line
+    log = io.StringIO()
+    print_phase("ENVIRONMENT VALIDATION", file=log)
+
+    errors = []
+    warnings = []
+
+    # Check API keys
+    if not os.getenv("KUMO_API_KEY"):
+        errors.append("KUMO_API_KEY environment variable not set")
+    else:
+        print("✓ KUMO_API_KEY is set", file=log)
+
+    if not os.getenv("OPENAI_API_KEY"):
+        errors.append("OPENAI_API_KEY environment variable not set")
+    else:
+        print("✓ OPENAI_API_KEY is set", file=log)
+
+    # Check data path
+    data_path = os.getenv("INSURANCE_DATA_PATH", DEFAULT_DATA_PATH)
+    has_default_data = os.path.exists(data_path)
+
+    if allow_upload:
+        # Data is optional since users can upload
+        has_uploads = has_uploaded_data()
+        if not has_default_data and not has_uploads:
+            warnings.append(f"No data found at {data_path} or {UPLOAD_DIR}/")
+            warnings.append("Please upload data using the Data Upload tab")
+            print(f"⚠ No data found - upload required", file=log)
+        else:
+            if has_default_data:
+                print(f"✓ Default data file found: {data_path}", file=log)
+            if has_uploads:
+                print(f"✓ Uploaded data found: {UPLOAD_DIR}/", file=log)
+    elif not has_default_data:
+        warnings.append(f"Data file not found: {data_path}")
+        print(f"⚠ Data file not found: {data_path}", file=log)
+    else:
+        print(f"✓ Data file found: {data_path}", file=log)
+
+    # Print errors
+    if errors:
+        print("\n❌ VALIDATION FAILED:", file=log)
+        for error in errors:
+            print(f"  • {error}", file=log)
+        print("\nPlease check your .env file and ensure all required variables are set.", file=log)
+        print("See .env.template for reference.", file=log)
+        flush_log(log)
+        return False
+
+    # Print warnings
+    if warnings:
+        print("\n⚠️  WARNINGS:", file=log)
+        for warning in warnings:
+            print(f"  • {warning}", file=log)
+
+    print("\n✅ Environment validation passed!", file=log)
+    flush_log(log)
+    return True
+
+
+def load_and_profile(
+    data_path: str,
+    schema_output: Optional[str] = None
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Phase 1: load and profile the insurance data.
+
+    Args:
+        data_path: Path to Parquet file or directory containing Parquet files
+        schema_output: Optional path to export the profiled schema as JSON
+
+    Returns:
+        Tuple of (tables, schema_info)
+    """
+    from .data_loader import InsuranceDataLoader
+
+    print_phase("PHASE 1: DATA LOADING AND PROFILING")
+
+    loader = InsuranceDataLoader(data_path)
+    tables = loader.load_data()
+    schema_info = loader.profile_data()
+    loader.validate_temporal_columns()
+    loader.check_duplicates()
+    if schema_output:
+        loader.export_schema(schema_output)
+
+    print("\n✅ Phase 1 complete: Data loaded and profiled")
+    return tables, schema_info
+
+
+def init_kumo(tables: Dict[str, Any]) -> Tuple["KumoSetup", Dict[str, Any]]:
+    """
+    Phase 2: authenticate with KumoRFM, import tables and materialize the graph.
+
+    Args:
+        tables: Dictionary mapping table names to DataFrames
+
+    Returns:
+        Tuple of (kumo_setup, graph_schema)
+    """
+    from .kumo_setup import KumoSetup
+
+    print_phase("PHASE 2: KUMORFM INITIALIZATION")
+
+    kumo = KumoSetup()
+    kumo.authenticate()
+
+    # Import dataset
+    local_tables = kumo.import_dataset(tables, auto_infer_metadata=True)
+
+    # Create graph with auto-inferred links
+    # Note: Manual links can be added if auto-inference doesn't work
+    # Example manual links:
+    # manual_links = [
+    #     {"src_table": "claims", "fkey": "customer_id", "dst_table": "customers"},
+    #     {"src_table": "claims", "fkey": "policy_id", "dst_table": "policies"}
+    # ]
+    kumo.create_graph(local_tables, auto_infer_links=True)
+
+    # Materialize graph
+    kumo.materialize_graph()
+
+    # Get graph schema
+    graph_schema = kumo.get_graph_schema()
+
+    print("\n✅ Phase 2 complete: KumoRFM initialized and graph materialized")
+    return kumo, graph_schema
+
+
+def make_agent(
+    kumo: "KumoSetup",
+    graph_schema: Dict[str, Any],
+    openai_model: Optional[str] = None
+) -> "KumoConversationAgent":
+    """
+    Phases 3-4: create the NL to PQL translator and the conversational agent.
+
+    Args:
+        kumo: KumoSetup instance with materialized model
+        graph_schema: Graph schema dictionary
+        openai_model: OpenAI model name (default: OPENAI_MODEL or gpt-4o-mini)
+
+    Returns:
+        KumoConversationAgent instance
+    """
+    from .text_to_pql import TextToPQLTranslator
+    from .kumo_agent import KumoConversationAgent
+
+    print_phase("PHASE 3: NL TO PQL TRANSLATOR INITIALIZATION")
+
+    openai_model = openai_model or os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+    translator = TextToPQLTranslator(graph_schema, model=openai_model)
+
+    print(f"\n✅ Phase 3 complete: Translator initialized with model {openai_model}")
+
+    print_phase("PHASE 4: CONVERSATIONAL AGENT CREATION")
+
+    agent = KumoConversationAgent(kumo, translator, graph_schema)
+
+    print("\n✅ Phase 4 complete: Conversational agent created")
+    return agent
+
+
+def bootstrap_agent(
+    data_path: str,
+    schema_output: Optional[str] = None,
+    openai_model: Optional[str] = None
+) -> Tuple["KumoConversationAgent", Dict[str, Any]]:
+    """
+    Run Phases 1-4 and return a ready conversational agent.
+
+    Args:
+        data_path: Path to Parquet file or directory containing Parquet files
+        schema_output: Optional path to export the profiled schema as JSON
+        openai_model: OpenAI model name (default: OPENAI_MODEL or gpt-4o-mini)
+
+    Returns:
+        Tuple of (agent, graph_schema)
+    """
+    tables, _ = load_and_profile(data_path, schema_output=schema_output)
+    kumo, graph_schema = init_kumo(tables)
+    agent = make_agent(kumo, graph_schema, openai_model=openai_model)
+    return agent, graph_schema
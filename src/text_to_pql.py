@@ -3,61 +3,54 @@ Text to PQL Translation Module
 Converts natural language queries to KumoRFM PQL using OpenAI.
 """
 
+import hashlib
+import logging
 import os
-import json
 import re
-from typing import Dict, List, Optional, Any
-from openai import OpenAI
-
-
-class TextToPQLTranslator:
-    """
-    Translates natural language queries to KumoRFM Predictive Query Language (PQL).
-    Uses OpenAI GPT models for intelligent translation.
-    """
-    
-    def __init__(self, graph_schema: Dict[str, Any], model: str = "gpt-4o-mini"):
-        """
-        Initialize translator with graph schema.
-        
-        Args:
-            graph_schema: Dictionary containing graph structure (tables, columns, relationships)
-            model: OpenAI model to use (default: gpt-4o-mini, can also use gpt-4o)
-        """
-        self.graph_schema = graph_schema
-        self.model = model
-        self.client = None
-        self.pql_knowledge_base = self._build_pql_knowledge_base()
-        self._initialize_openai()
-    
-    def _initialize_openai(self):
-        """
-        Initialize OpenAI client using API key from environment.
-        
-        Raises:
-            ValueError: If OPENAI_API_KEY environment variable is not set
-        """
-        api_key = os.getenv("OPENAI_API_KEY")
-        
-        if not api_key:
-            raise ValueError(
-                "OPENAI_API_KEY environment variable not set.\n"
-                "Please set it in your .env file or environment:\n"
-                "  export OPENAI_API_KEY='your-api-key-here'\n"
-                "Get your API key at: https://platform.openai.com/api-keys"
-            )
-        
-        self.client = OpenAI(api_key=api_key)
-        print("✓ OpenAI client initialized successfully")
-    
-    def _build_pql_knowledge_base(self) -> str:
-        """
-        Build PQL knowledge base with insurance-specific examples.
-        
-        Returns:
-            String containing PQL patterns and examples
-        """
-        knowledge_base = """
+import threading
+from functools import lru_cache
+from typing import Dict, List, Mapping, Optional, Any, Tuple
+import orjson
+
+from .kumo_setup import schema_json_default
+
+
+logger = logging.getLogger(__name__)
+
+# Persistent translation cache file; off unless PQL_CACHE_PATH names it
+PQL_CACHE_PATH_ENV = "PQL_CACHE_PATH"
+PQL_CACHE_MAX_ENTRIES = 1000
+# Only translations at least this confident are persisted
+PQL_CACHE_MIN_CONFIDENCE = 0.8
+# Sampling temperature for translations; part of the cache key
+TRANSLATION_TEMPERATURE = 0.1
+# Completion budget for one translation; the JSON answer is well under this
+TRANSLATION_MAX_TOKENS = 256
+# In-memory explain_pql() results kept per translator
+EXPLANATION_CACHE_MAX_ENTRIES = 256
+
+
+# Quoted string literals in a PQL query, which normalization leaves untouched
+_PQL_LITERAL_RE = re.compile(r"""('(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")""")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Keywords checked by PQL validation, matched against the uppercased query
+_VALID_AGGS = frozenset({"COUNT", "SUM", "AVG", "MIN", "MAX", "LIST_DISTINCT"})
+_VALID_TIME_UNITS = frozenset({"DAYS", "HOURS", "MONTHS", "YEARS"})
+
+# Result template for responses that cannot be parsed as JSON; copied per use
+_PARSE_ERROR_RESULT = {
+    "pql_query": None,
+    "query_type": "error",
+    "confidence": 0.0,
+    "requires_clarification": True,
+    "clarification_question": "I couldn't process that query. Could you rephrase it?",
+}
+
+
+# PQL syntax reference with insurance-specific examples, embedded in the
+# system prompt of every translator
+_PQL_KNOWLEDGE_BASE = """
 # PQL (Predictive Query Language) Knowledge Base
 
 ## Core PQL Syntax Patterns
@@ -153,7 +146,295 @@ class TextToPQLTranslator:
 - Foreign keys establish relationships between tables
 - Aggregations work on temporal windows (start, end, unit)
 """
-        return knowledge_base
+
+def _normalize_pql(pql_query: str) -> str:
+    """
+    Canonical form of a PQL query for validation: whitespace runs outside
+    string literals collapse to one space and keywords/identifiers are
+    uppercased, so formatting variants of a query share one cache entry.
+    """
+    parts = _PQL_LITERAL_RE.split(pql_query)
+    # split() with a capturing group alternates code (even) and literals (odd)
+    for i in range(0, len(parts), 2):
+        parts[i] = _WHITESPACE_RE.sub(" ", parts[i]).upper()
+    return "".join(parts).strip()
+
+
+def _read_json_stream(stream) -> str:
+    """
+    Accumulate a streamed chat completion until its first JSON object closes.
+
+    Braces are counted outside string literals only. Returns the balanced
+    object text as soon as it is complete, or the whole response if no
+    object closes (e.g. a truncated response), for the caller's error handling.
+    """
+    parts = []
+    depth = 0
+    start = None
+    in_string = False
+    escaped = False
+    offset = 0
+    for chunk in stream:
+        if not chunk.choices:
+            continue
+        content = chunk.choices[0].delta.content
+        if not content:
+            continue
+        parts.append(content)
+        for i, ch in enumerate(content):
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif ch == "\\":
+                    escaped = True
+                elif ch == '"':
+                    in_string = False
+            elif ch == '"':
+                in_string = start is not None
+            elif ch == "{":
+                if start is None:
+                    start = offset + i
+                depth += 1
+            elif ch == "}" and start is not None:
+                depth -= 1
+                if depth == 0:
+                    text = "".join(parts)
+                    return text[start:offset + i + 1]
+        offset += len(content)
+    return "".join(parts).strip()
+
+
+def _compact_schema(schema: Dict[str, Any]) -> str:
+    """
+    One-line-per-table text summary of a graph schema for the system prompt.
+    
+    Renders `table(pk=..., time=...): column:stype, ...` lines followed by
+    `links:` lines, which carries what the model needs in a fraction of the
+    tokens of the JSON dump. Schemas not shaped like KumoSetup.get_graph_schema
+    output fall back to compact JSON. Tables are sorted so the prompt is
+    stable across processes.
+    """
+    tables = schema.get("tables")
+    if not isinstance(tables, Mapping) or not all(
+            isinstance(t, Mapping) and isinstance(t.get("columns", {}), Mapping)
+            for t in tables.values()):
+        return orjson.dumps(schema, default=schema_json_default, option=orjson.OPT_SORT_KEYS).decode()
+    
+    lines = []
+    for table_name in sorted(tables):
+        table = tables[table_name]
+        keys = [f"{label}={table[field]}"
+                for field, label in (("primary_key", "pk"), ("time_column", "time"))
+                if table.get(field)]
+        columns = []
+        for col_name, col in table.get("columns", {}).items():
+            stype = col.get("stype") if isinstance(col, Mapping) else None
+            if not stype or stype == "unknown":
+                stype = col.get("dtype", "unknown") if isinstance(col, Mapping) else "unknown"
+            columns.append(f"{col_name}:{stype}")
+        header = f"{table_name}({', '.join(keys)})" if keys else table_name
+        lines.append(f"{header}: {', '.join(columns)}")
+    
+    links = [f"{r['src_table']}.{r['fkey']} -> {r['dst_table']}"
+             for r in schema.get("relationships", [])]
+    if links:
+        lines.append("links: " + "; ".join(links))
+    return "\n".join(lines)
+
+
+@lru_cache(maxsize=1)
+def _shared_http_client():
+    """
+    Process-wide HTTP client shared by every translator's OpenAI client.
+    
+    Reusing one connection pool avoids a TLS handshake per translator
+    instance. HTTP/2 is enabled when the optional `h2` package is installed.
+    The client lives for the whole process; callers must not close it.
+    """
+    import importlib.util
+    import httpx
+    
+    return httpx.Client(
+        http2=importlib.util.find_spec("h2") is not None,
+        limits=httpx.Limits(max_keepalive_connections=32),
+    )
+
+
+@lru_cache(maxsize=1024)
+def _validate_pql(pql_query: str) -> Tuple[bool, str]:
+    """
+    Syntactic PQL checks, memoized by normalized query string.
+    
+    The checks depend only on the query text, so the same PQL validated by
+    translate(), the chat handlers and the Direct PQL tab is checked once.
+    """
+    if not pql_query:
+        return False, "PQL query is empty or invalid type"
+    
+    upper = pql_query.upper()
+    
+    # Check for PREDICT keyword
+    if not upper.lstrip().startswith("PREDICT"):
+        return False, "PQL query must start with PREDICT"
+    
+    # Check for FOR keyword (required for entity specification)
+    if " FOR " not in upper:
+        return False, "PQL query must contain FOR clause"
+    
+    # Check balanced parentheses
+    if pql_query.count("(") != pql_query.count(")"):
+        return False, "Unbalanced parentheses in PQL query"
+    
+    # Check for valid aggregation functions
+    has_agg = any(agg in upper for agg in _VALID_AGGS)
+    
+    # Check for valid time units if temporal query
+    has_time_unit = any(unit in upper for unit in _VALID_TIME_UNITS)
+    
+    # If has aggregation, should have time unit (for temporal queries)
+    if has_agg and "LIST_DISTINCT" not in upper:
+        if not has_time_unit:
+            return False, "Temporal aggregation query should specify time unit (days/hours/months/years)"
+    
+    return True, "PQL query appears valid"
+
+
+class TextToPQLTranslator:
+    """
+    Translates natural language queries to KumoRFM Predictive Query Language (PQL).
+    Uses OpenAI GPT models for intelligent translation.
+    """
+    
+    def __init__(
+        self,
+        graph_schema: Dict[str, Any],
+        model: str = "gpt-4o-mini",
+        cache_path: Optional[str] = None
+    ):
+        """
+        Initialize translator with graph schema.
+        
+        Args:
+            graph_schema: Dictionary containing graph structure (tables, columns, relationships)
+            model: OpenAI model to use (default: gpt-4o-mini, can also use gpt-4o)
+            cache_path: JSON file persisting confident translations across runs
+                (default: PQL_CACHE_PATH; unset or empty disables the cache)
+        """
+        self.graph_schema = graph_schema
+        self.model = model
+        self.client = None
+        self._system_prompt = self._create_system_prompt()
+        
+        if cache_path is None:
+            cache_path = os.getenv(PQL_CACHE_PATH_ENV, "")
+        self.cache_path = os.path.expanduser(cache_path) if cache_path else None
+        self._cache = None  # Loaded on first use
+        self._cache_lock = threading.Lock()
+        # explain_pql() results by (model, query)
+        self._explanations: Dict[Tuple[str, str], str] = {}
+        
+        self._initialize_openai()
+    
+    @property
+    def graph_schema(self) -> Dict[str, Any]:
+        """Graph schema the system prompt is built from."""
+        return self._graph_schema
+    
+    @graph_schema.setter
+    def graph_schema(self, graph_schema: Dict[str, Any]) -> None:
+        # Reassigning the schema invalidates the cached system prompt and
+        # schema hash
+        self._graph_schema = graph_schema
+        self._system_prompt = None
+        self._schema_hash = None
+    
+    @property
+    def system_prompt(self) -> str:
+        """System prompt for the current schema, built once and reused."""
+        if self._system_prompt is None:
+            self._system_prompt = self._create_system_prompt()
+        return self._system_prompt
+    
+    @property
+    def prompt_cache_key(self) -> str:
+        """Routing key for OpenAI prompt caching, derived from the system prompt."""
+        return hashlib.sha256(self.system_prompt.encode()).hexdigest()[:32]
+    
+    @property
+    def schema_hash(self) -> str:
+        """Hash of the full graph schema, so any schema change misses the cache."""
+        if self._schema_hash is None:
+            dump = orjson.dumps(
+                self.graph_schema,
+                default=schema_json_default,
+                option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+            )
+            self._schema_hash = hashlib.sha256(dump).hexdigest()
+        return self._schema_hash
+    
+    def _cache_key(self, user_query: str) -> str:
+        """Key a translation by everything that determines it."""
+        material = "\0".join([
+            self.schema_hash, self.system_prompt, self.model,
+            str(TRANSLATION_TEMPERATURE), user_query
+        ])
+        return hashlib.sha256(material.encode()).hexdigest()
+    
+    def _load_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Return the persisted translations, reading the file on first use."""
+        if self._cache is None:
+            try:
+                with open(self.cache_path, 'rb') as f:
+                    cache = orjson.loads(f.read())
+                self._cache = cache if isinstance(cache, dict) else {}
+            except (OSError, ValueError):
+                self._cache = {}
+        return self._cache
+    
+    def _get_cached_translation(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of a persisted translation, or None on a miss."""
+        with self._cache_lock:
+            cached = self._load_cache().get(key)
+        return dict(cached) if cached is not None else None
+    
+    def _store_translation(self, key: str, result: Dict[str, Any]) -> None:
+        """Persist a translation; failures are non-fatal."""
+        with self._cache_lock:
+            cache = self._load_cache()
+            cache[key] = dict(result)
+            # Keep the most recent entries (dicts preserve insertion order)
+            while len(cache) > PQL_CACHE_MAX_ENTRIES:
+                del cache[next(iter(cache))]
+            try:
+                os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+                tmp_path = f"{self.cache_path}.tmp"
+                with open(tmp_path, 'wb') as f:
+                    f.write(orjson.dumps(cache, default=str))
+                os.replace(tmp_path, self.cache_path)
+            except OSError:
+                pass
+    
+    def _initialize_openai(self):
+        """
+        Initialize OpenAI client using API key from environment.
+        
+        Raises:
+            ValueError: If OPENAI_API_KEY environment variable is not set
+        """
+        api_key = os.getenv("OPENAI_API_KEY")
+        
+        if not api_key:
+            raise ValueError(
+                "OPENAI_API_KEY environment variable not set.\n"
+                "Please set it in your .env file or environment:\n"
+                "  export OPENAI_API_KEY='your-api-key-here'\n"
+                "Get your API key at: https://platform.openai.com/api-keys"
+            )
+        
+        # Imported here so that a missing API key fails before loading openai
+        from openai import OpenAI
+        self.client = OpenAI(api_key=api_key, http_client=_shared_http_client())
+        logger.info("✓ OpenAI client initialized successfully")
     
     def _create_system_prompt(self) -> str:
         """
@@ -162,7 +443,10 @@ class TextToPQLTranslator:
         Returns:
             System prompt string
         """
-        schema_summary = json.dumps(self.graph_schema, indent=2)
+        # A sorted, flattened summary keeps the prompt byte-identical across
+        # processes for OpenAI's prefix cache and costs far fewer input tokens
+        # than the schema JSON
+        schema_summary = _compact_schema(self.graph_schema)
         
         system_prompt = f"""You are an expert PQL (Predictive Query Language) translator for KumoRFM insurance claims analysis.
 
@@ -172,7 +456,7 @@ Your task is to convert natural language queries into valid PQL queries based on
 {schema_summary}
 
 ## PQL Knowledge Base
-{self.pql_knowledge_base}
+{_PQL_KNOWLEDGE_BASE}
 
 ## Output Format
 You MUST return ONLY a valid JSON object with the following structure:
@@ -225,6 +509,108 @@ Now translate user queries following these rules strictly.
 """
         return system_prompt
     
+    def _lookup_cached(
+        self,
+        user_query: str,
+        conversation_context: Optional[List[Dict[str, str]]]
+    ) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """
+        Return (cache_key, cached_result) for a query.
+        
+        Queries with conversation context are not cached, since the context
+        changes the translation; both values are None for them.
+        """
+        if not self.cache_path or conversation_context:
+            return None, None
+        cache_key = self._cache_key(user_query)
+        cached = self._get_cached_translation(cache_key)
+        if cached is not None:
+            logger.info("✓ Translation served from cache (confidence: %.2f)", cached.get('confidence', 0))
+        return cache_key, cached
+    
+    def cached_translation(self, user_query: str) -> Optional[Dict[str, Any]]:
+        """Return the persisted translation of a query, or None, without an API call."""
+        return self._lookup_cached(user_query, None)[1]
+    
+    def _build_messages(
+        self,
+        user_query: str,
+        conversation_context: Optional[List[Dict[str, str]]]
+    ) -> List[Dict[str, str]]:
+        """Build the chat messages for one translation request."""
+        # The system prompt is a fixed prefix shared by every call; per-call
+        # content only follows it, so OpenAI's prompt caching can reuse the
+        # prefix
+        messages = [
+            {"role": "system", "content": self.system_prompt}
+        ]
+        
+        # Add conversation context if provided
+        if conversation_context:
+            messages.extend(conversation_context)
+        
+        # Add user query
+        messages.append({"role": "user", "content": user_query})
+        return messages
+    
+    def _request_options(self) -> Dict[str, Any]:
+        """Keyword arguments shared by the sync and async completion calls."""
+        return {
+            "model": self.model,
+            "temperature": TRANSLATION_TEMPERATURE,  # Low temperature for more deterministic output
+            "max_tokens": TRANSLATION_MAX_TOKENS,
+            # JSON mode: the API only returns parseable JSON objects (the
+            # system prompt must mention JSON, which it does)
+            "response_format": {"type": "json_object"},
+            # Sent as a raw body field so older SDKs without the
+            # prompt_cache_key parameter still pass it through
+            "extra_body": {"prompt_cache_key": self.prompt_cache_key},
+        }
+    
+    def _finish_translation(self, response_text: str, cache_key: Optional[str]) -> Dict[str, Any]:
+        """Parse and validate a model response, persisting it if confident."""
+        # Parse JSON response
+        try:
+            result = orjson.loads(response_text)
+        except orjson.JSONDecodeError:
+            # JSON mode makes this rare (e.g. output cut off at max_tokens)
+            result = {
+                **_PARSE_ERROR_RESULT,
+                "explanation": f"Failed to parse response as JSON: {response_text[:200]}",
+                "suggested_entities": []
+            }
+        
+        # Validate PQL if generated
+        if result.get("pql_query"):
+            is_valid, validation_msg = self.validate_pql(result["pql_query"])
+            if not is_valid:
+                result["confidence"] *= 0.5  # Reduce confidence
+                result["explanation"] += f" (Validation warning: {validation_msg})"
+        
+        logger.info("✓ Translation complete (confidence: %.2f)", result.get('confidence', 0))
+        
+        if (cache_key and result.get("pql_query") and not result.get("requires_clarification")
+                and result.get("confidence", 0) >= PQL_CACHE_MIN_CONFIDENCE):
+            self._store_translation(cache_key, result)
+        # Marks a result validated just now against the current schema; set
+        # after persisting, so results served from the cache never carry it
+        result["validated"] = True
+        return result
+    
+    @staticmethod
+    def _translation_error(e: Exception) -> Dict[str, Any]:
+        """Result returned when the translation request itself fails."""
+        logger.error("✗ Translation failed: %s", e)
+        return {
+            "pql_query": None,
+            "query_type": "error",
+            "confidence": 0.0,
+            "explanation": f"Translation error: {str(e)}",
+            "requires_clarification": True,
+            "clarification_question": "I encountered an error. Could you rephrase your query?",
+            "suggested_entities": []
+        }
+    
     def translate(
         self, 
         user_query: str, 
@@ -240,73 +626,35 @@ Now translate user queries following these rules strictly.
         Returns:
             Dictionary with PQL query and metadata
         """
-        print(f"\n🔄 Translating query: '{user_query}'")
+        logger.info("🔄 Translating query: '%s'", user_query)
         
-        # Build messages
-        messages = [
-            {"role": "system", "content": self._create_system_prompt()}
-        ]
+        # Repeat questions are answered from the persistent cache
+        cache_key, cached = self._lookup_cached(user_query, conversation_context)
+        if cached is not None:
+            return cached
         
-        # Add conversation context if provided
-        if conversation_context:
-            messages.extend(conversation_context)
-        
-        # Add user query
-        messages.append({"role": "user", "content": user_query})
+        messages = self._build_messages(user_query, conversation_context)
         
         try:
-            # Call OpenAI API
-            response = self.client.chat.completions.create(
-                model=self.model,
+            # Call OpenAI API. The response is streamed so parsing can start
+            # as soon as the JSON object closes instead of after the full
+            # completion
+            stream = self.client.chat.completions.create(
                 messages=messages,
-                temperature=0.1,  # Low temperature for more deterministic output
-                max_tokens=500
+                stream=True,
+                **self._request_options()
             )
             
-            # Extract response
-            response_text = response.choices[0].message.content.strip()
-            
-            # Parse JSON response
+            # Extract response, dropping any tokens after the JSON object
             try:
-                result = json.loads(response_text)
-            except json.JSONDecodeError:
-                # Try to extract JSON from markdown code blocks if present
-                json_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', response_text, re.DOTALL)
-                if json_match:
-                    result = json.loads(json_match.group(1))
-                else:
-                    # Fallback: return error
-                    result = {
-                        "pql_query": None,
-                        "query_type": "error",
-                        "confidence": 0.0,
-                        "explanation": f"Failed to parse response as JSON: {response_text[:200]}",
-                        "requires_clarification": true,
-                        "clarification_question": "I couldn't process that query. Could you rephrase it?",
-                        "suggested_entities": []
-                    }
-            
-            # Validate PQL if generated
-            if result.get("pql_query"):
-                is_valid, validation_msg = self.validate_pql(result["pql_query"])
-                if not is_valid:
-                    result["confidence"] *= 0.5  # Reduce confidence
-                    result["explanation"] += f" (Validation warning: {validation_msg})"
+                response_text = _read_json_stream(stream)
+            finally:
+                stream.close()
             
-            print(f"✓ Translation complete (confidence: {result.get('confidence', 0):.2f})")
-            return result
+            return self._finish_translation(response_text, cache_key)
             
         except Exception as e:
-            print(f"✗ Translation failed: {e}")
-            return {
-                "pql_query": None,
-                "query_type": "error",
-                "confidence": 0.0,
-                "explanation": f"Translation error: {str(e)}",
-                "requires_clarification": True,
-                "clarification_question": "I encountered an error. Could you rephrase your query?",
-                "suggested_entities": []
-            }
+            return self._translation_error(e)
     
     def validate_pql(self, pql_query: str) -> tuple[bool, str]:
         """
@@ -318,46 +666,28 @@ Now translate user queries following these rules strictly.
         Returns:
             Tuple of (is_valid, message)
         """
-        if not pql_query or not isinstance(pql_query, str):
+        if not isinstance(pql_query, str):
             return False, "PQL query is empty or invalid type"
-        
-        # Check for PREDICT keyword
-        if not pql_query.strip().upper().startswith("PREDICT"):
-            return False, "PQL query must start with PREDICT"
-        
-        # Check for FOR keyword (required for entity specification)
-        if " FOR " not in pql_query.upper():
-            return False, "PQL query must contain FOR clause"
-        
-        # Check balanced parentheses
-        if pql_query.count("(") != pql_query.count(")"):
-            return False, "Unbalanced parentheses in PQL query"
-        
-        # Check for valid aggregation functions
-        valid_aggs = ["COUNT", "SUM", "AVG", "MIN", "MAX", "LIST_DISTINCT"]
-        has_agg = any(agg in pql_query.upper() for agg in valid_aggs)
-        
-        # Check for valid time units if temporal query
-        valid_time_units = ["days", "hours", "months", "years"]
-        has_time_unit = any(unit in pql_query.lower() for unit in valid_time_units)
-        
-        # If has aggregation, should have time unit (for temporal queries)
-        if has_agg and "LIST_DISTINCT" not in pql_query.upper():
-            if not has_time_unit:
-                return False, "Temporal aggregation query should specify time unit (days/hours/months/years)"
-        
-        return True, "PQL query appears valid"
+        return _validate_pql(_normalize_pql(pql_query))
     
     def explain_pql(self, pql_query: str) -> str:
         """
         Generate human-readable explanation of a PQL query.
         
+        Explanations are cached per model and query text, so
+        re-explaining the same PQL skips the API call.
+        
         Args:
             pql_query: PQL query to explain
         
         Returns:
             Human-readable explanation
         """
+        key = (self.model, pql_query.strip())
+        cached = self._explanations.get(key)
+        if cached is not None:
+            return cached
+        
         try:
             messages = [
                 {
@@ -377,16 +707,23 @@ Now translate user queries following these rules strictly.
                 max_tokens=200
             )
             
-            return response.choices[0].message.content.strip()
+            explanation = response.choices[0].message.content.strip()
             
         except Exception as e:
             return f"Could not generate explanation: {e}"
+        
+        # Failures are not cached; keep the most recent entries
+        if len(self._explanations) >= EXPLANATION_CACHE_MAX_ENTRIES:
+            del self._explanations[next(iter(self._explanations))]
+        self._explanations[key] = explanation
+        return explanation
 
 
 def main():
     """
     Example usage and testing.
     """
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     print("Text-to-PQL Translator - Test Mode")
     print("="*80)
     
@@ -3,12 +3,46 @@ Gradio Upload UI Component
 Provides a user interface for uploading Excel files and converting them to Parquet.
 """
 
-import gradio as gr
-import pandas as pd
+import hashlib
 import os
-from typing import Tuple, Dict, List
+from typing import TYPE_CHECKING, Tuple, Dict, List, Optional
+import orjson
 from .excel_converter import ExcelToParquetConverter
 
+# gradio is imported where the UI is built, so converting uploads and
+# checking for uploaded data do not load it
+if TYPE_CHECKING:
+    import gradio as gr
+
+
+UPLOAD_DIR = "uploaded_data"
+# Schema/relationship metadata written next to the converted tables
+METADATA_FILE = "upload_metadata.json"
+# Displays of previous conversions, keyed by workbook content digest
+ANALYSIS_CACHE_DIR = os.path.join(UPLOAD_DIR, ".cache")
+
+
+# Schema display row for one column, bound once at import
+_COLUMN_ROW = "| `{}` | {} | {:.1f}% | {:.1f}% |\n".format
+
+
+def _file_digest(path: str, chunk_size: int = 1 << 20) -> str:
+    """SHA-256 of a file's contents, read in 1 MiB chunks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _output_fingerprint(file_names: List[str]) -> Dict[str, List[int]]:
+    """Size and mtime of each conversion output file, to detect overwrites."""
+    fingerprint = {}
+    for file_name in file_names:
+        st = os.stat(os.path.join(UPLOAD_DIR, file_name))
+        fingerprint[file_name] = [st.st_size, st.st_mtime_ns]
+    return fingerprint
+
 
 class DataUploadUI:
     """
@@ -19,6 +53,8 @@ class DataUploadUI:
         """Initialize the upload UI."""
         self.converter = None
         self.current_metadata = None
+        # (directory mtime_ns, has entries) from the last upload-dir scan
+        self._upload_dir_state = None
     
     def process_upload(self, excel_file) -> Tuple[str, str, str]:
         """
@@ -34,11 +70,21 @@ class DataUploadUI:
             return "❌ No file uploaded", "", ""
         
         try:
+            # gr.File(type="filepath") passes a path; file objects carry .name
+            excel_path = getattr(excel_file, "name", excel_file)
+            
+            # Re-uploading a workbook whose Parquet output is still in place
+            # returns the earlier result without converting again
+            digest = _file_digest(excel_path)
+            cached = self._load_cached_result(digest)
+            if cached is not None:
+                return cached
+            
             # Create converter
-            self.converter = ExcelToParquetConverter(output_dir="uploaded_data")
+            self.converter = ExcelToParquetConverter(output_dir=UPLOAD_DIR)
             
             # Convert Excel to Parquet
-            tables = self.converter.convert_excel_to_parquet(excel_file.name)
+            tables = self.converter.convert_excel_to_parquet(excel_path)
             
             # Analyze schema
             schema_info = self.converter.analyze_schema()
@@ -47,7 +93,7 @@ class DataUploadUI:
             relationships = self.converter.infer_relationships()
             
             # Export metadata
-            self.converter.export_metadata()
+            self.converter.export_metadata(METADATA_FILE)
             
             # Validate conversion
             is_valid = self.converter.validate_conversion()
@@ -77,63 +123,109 @@ class DataUploadUI:
             # Format relationship display
             relationship_display = self._format_relationship_display(relationships)
             
-            return status_msg, schema_display, relationship_display
+            result = (status_msg, schema_display, relationship_display)
+            self._store_cached_result(digest, result, summary['table_names'])
+            return result
             
         except Exception as e:
             return f"❌ **Error during conversion:** {str(e)}", "", ""
     
+    def _load_cached_result(self, digest: str) -> Optional[Tuple[str, str, str]]:
+        """
+        Return the cached displays for a workbook digest, or None.
+        
+        The entry only counts if every Parquet file it describes and the
+        metadata file are unchanged, since a later upload may have
+        overwritten the converted tables or the metadata.
+        """
+        try:
+            with open(os.path.join(ANALYSIS_CACHE_DIR, f"{digest}.json"), 'rb') as f:
+                entry = orjson.loads(f.read())
+            if _output_fingerprint(list(entry["outputs"])) != entry["outputs"]:
+                return None
+            return tuple(entry["result"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+    
+    def _store_cached_result(
+        self,
+        digest: str,
+        result: Tuple[str, str, str],
+        table_names: List[str]
+    ) -> None:
+        """Persist the displays for a workbook digest; failures are non-fatal."""
+        try:
+            os.makedirs(ANALYSIS_CACHE_DIR, exist_ok=True)
+            outputs = [f"{table_name}.parquet" for table_name in table_names]
+            outputs.append(METADATA_FILE)
+            entry = {"result": list(result), "outputs": _output_fingerprint(outputs)}
+            cache_path = os.path.join(ANALYSIS_CACHE_DIR, f"{digest}.json")
+            tmp_path = f"{cache_path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(entry))
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+    
     def _format_schema_display(self, schema_info: Dict) -> str:
         """Format schema information for display."""
-        output = "## 📊 Schema Information\n\n"
+        # Pieces are collected and joined once; repeated += re-copies the
+        # growing string for every column row
+        parts = ["## 📊 Schema Information\n\n"]
+        append = parts.append
         
         for table_name, schema in schema_info.items():
-            output += f"### Table: `{table_name}`\n\n"
-            output += f"- **Rows:** {schema['row_count']:,}\n"
-            output += f"- **Columns:** {schema['column_count']}\n"
+            append(f"### Table: `{table_name}`\n\n")
+            append(f"- **Rows:** {schema['row_count']:,}\n")
+            append(f"- **Columns:** {schema['column_count']}\n")
             
             if schema['primary_key']:
-                output += f"- **Primary Key:** `{schema['primary_key']}`\n"
+                append(f"- **Primary Key:** `{schema['primary_key']}`\n")
             
             if schema['foreign_keys']:
-                output += f"- **Foreign Keys:** {', '.join(f'`{fk}`' for fk in schema['foreign_keys'])}\n"
+                append(f"- **Foreign Keys:** {', '.join(f'`{fk}`' for fk in schema['foreign_keys'])}\n")
             
             if schema['temporal_columns']:
-                output += f"- **Temporal Columns:** {', '.join(f'`{tc}`' for tc in schema['temporal_columns'])}\n"
+                append(f"- **Temporal Columns:** {', '.join(f'`{tc}`' for tc in schema['temporal_columns'])}\n")
             
-            output += "\n**Columns:**\n\n"
-            output += "| Column | Type | Nulls | Unique |\n"
-            output += "|--------|------|-------|--------|\n"
+            append("\n**Columns:**\n\n"
+                   "| Column | Type | Nulls | Unique |\n"
+                   "|--------|------|-------|--------|\n")
             
-            for col_name, col_info in schema['columns'].items():
-                null_pct = f"{col_info['null_percentage']:.1f}%"
-                unique_pct = f"{col_info['unique_percentage']:.1f}%"
-                output += f"| `{col_name}` | {col_info['dtype']} | {null_pct} | {unique_pct} |\n"
+            append("".join(
+                _COLUMN_ROW(name, info['dtype'], info['null_percentage'], info['unique_percentage'])
+                for name, info in schema['columns'].items()
+            ))
             
-            output += "\n---\n\n"
+            append("\n---\n\n")
         
-        return output
+        return "".join(parts)
     
     def _format_relationship_display(self, relationships: List[Dict]) -> str:
         """Format relationship information for display."""
         if not relationships:
             return "## 🔗 Relationships\n\n⚠️ No relationships automatically inferred.\n\nYou may need to manually define relationships in the configuration."
         
-        output = "## 🔗 Inferred Relationships\n\n"
-        output += "| Source Table | Foreign Key | Target Table | Target Key |\n"
-        output += "|--------------|-------------|--------------|------------|\n"
-        
-        for rel in relationships:
-            output += f"| `{rel['src_table']}` | `{rel['fkey']}` | `{rel['dst_table']}` | `{rel['dst_key']}` |\n"
-        
-        return output
+        parts = [
+            "## 🔗 Inferred Relationships\n\n",
+            "| Source Table | Foreign Key | Target Table | Target Key |\n",
+            "|--------------|-------------|--------------|------------|\n",
+        ]
+        parts.extend(
+            f"| `{rel['src_table']}` | `{rel['fkey']}` | `{rel['dst_table']}` | `{rel['dst_key']}` |\n"
+            for rel in relationships
+        )
+        return "".join(parts)
     
-    def create_upload_tab(self) -> gr.Tab:
+    def create_upload_tab(self) -> "gr.Tab":
         """
         Create the Gradio upload tab.
         
         Returns:
             Gradio Tab component
         """
+        import gradio as gr
+        
         with gr.Tab("📤 Data Upload") as tab:
             gr.Markdown("""
             # 📤 Upload Your Insurance Data
@@ -193,25 +285,49 @@ class DataUploadUI:
         Returns:
             Path to uploaded_data directory
         """
-        return "uploaded_data" if os.path.exists("uploaded_data") else None
+        return UPLOAD_DIR if self._upload_dir_mtime() is not None else None
     
     def has_uploaded_data(self) -> bool:
         """
         Check if data has been uploaded.
         
+        The directory is only rescanned when its mtime changes (entries were
+        added or removed), since the UI calls this on every refresh. The
+        analysis cache directory does not count as uploaded data.
+        
         Returns:
             True if uploaded data exists
         """
-        return os.path.exists("uploaded_data") and len(os.listdir("uploaded_data")) > 0
+        mtime = self._upload_dir_mtime()
+        if mtime is None:
+            return False
+        if self._upload_dir_state is None or self._upload_dir_state[0] != mtime:
+            try:
+                with os.scandir(UPLOAD_DIR) as entries:
+                    has_entries = any(not e.name.startswith(".") for e in entries)
+            except OSError:
+                return False
+            self._upload_dir_state = (mtime, has_entries)
+        return self._upload_dir_state[1]
+    
+    @staticmethod
+    def _upload_dir_mtime() -> Optional[int]:
+        """mtime of the upload directory in ns, or None if it does not exist."""
+        try:
+            return os.stat(UPLOAD_DIR).st_mtime_ns
+        except OSError:
+            return None
 
 
-def create_upload_interface() -> gr.Blocks:
+def create_upload_interface() -> "gr.Blocks":
     """
     Create standalone upload interface for testing.
     
     Returns:
         Gradio Blocks interface
     """
+    import gradio as gr
+    
     upload_ui = DataUploadUI()
     
     with gr.Blocks(title="Data Upload - FraudAGENT") as interface:
@@ -115,6 +115,229 @@ def test_main_module():
     return True
 
 
+def test_semantic_cache():
+    """Test the agent's semantic translation cache (no API calls)."""
+    print("\n" + "="*80)
+    print("TEST 6: Semantic Translation Cache")
+    print("="*80)
+    
+    from types import SimpleNamespace
+    from src.kumo_agent import KumoConversationAgent
+    
+    # Questions embed onto fixed unit vectors; the paraphrase is ~0.99
+    # similar to the original, the unrelated question ~0.0
+    vectors = {
+        "Is claim 12345 fraudulent?": [1.0, 0.0],
+        "Is claim 12345 a fraud?": [0.99, 0.14],
+        "Is claim 12346 a fraud?": [0.99, 0.14],
+        "How many claims next month?": [0.0, 1.0],
+    }
+    
+    class FakeEmbeddings:
+        def create(self, model, input):
+            if input not in vectors:
+                raise TimeoutError("embedding timed out")
+            return SimpleNamespace(data=[SimpleNamespace(embedding=vectors[input])])
+    
+    class FakeClient:
+        embeddings = FakeEmbeddings()
+        
+        def with_options(self, **kwargs):
+            return self
+    
+    class FakeTranslator:
+        client = FakeClient()
+        
+        def __init__(self):
+            self.calls = []
+        
+        def validate_pql(self, pql_query):
+            return True, ""
+        
+        def cached_translation(self, user_query):
+            return None
+        
+        def translate(self, user_query):
+            self.calls.append(user_query)
+            return {"pql_query": f"PQL for {user_query}", "confidence": 0.9}
+    
+    translator = FakeTranslator()
+    agent = KumoConversationAgent(None, translator, {}, semantic_cache_threshold=0.92)
+    
+    agent._translate("Is claim 12345 fraudulent?")
+    result = agent._translate("Is claim 12345 a fraud?")
+    assert len(translator.calls) == 1, "Paraphrase with the same numbers should hit the cache"
+    assert result["pql_query"] == "PQL for Is claim 12345 fraudulent?"
+    print("✓ Paraphrase with the same numbers reuses the translation")
+    
+    agent._translate("Is claim 12346 a fraud?")
+    assert translator.calls[-1] == "Is claim 12346 a fraud?", "Different numbers must not collide"
+    print("✓ Near-duplicate with different numbers is translated again")
+    
+    agent._translate("How many claims next month?")
+    assert len(translator.calls) == 3, "Dissimilar question should miss"
+    print("✓ Question below the similarity threshold misses")
+    
+    agent._translate("Unembeddable question")
+    assert translator.calls[-1] == "Unembeddable question", "Embedding failure should fall through"
+    print("✓ Embedding failure falls through to translation")
+    
+    print("\n✅ Semantic Cache Test PASSED")
+    return True
+
+
+def test_profile_cache():
+    """Test the opt-in profile cache and its invalidation."""
+    print("\n" + "="*80)
+    print("TEST 7: Profile Cache")
+    print("="*80)
+    
+    import os
+    import shutil
+    import tempfile
+    from unittest import mock
+    from src.data_loader import InsuranceDataLoader
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        data_dir = os.path.join(tmp_dir, "data")
+        shutil.copytree("data", data_dir)
+        cache_path = os.path.join(tmp_dir, "profile_cache.json")
+        
+        with mock.patch.dict(os.environ, {"PROFILE_CACHE_PATH": ""}):
+            loader = InsuranceDataLoader(data_dir)
+            loader.load_data()
+            loader.profile_data()
+            assert not os.path.exists(cache_path), "Cache should be off unless PROFILE_CACHE_PATH is set"
+        print("✓ Cache disabled by default")
+        
+        with mock.patch.dict(os.environ, {"PROFILE_CACHE_PATH": cache_path}):
+            loader = InsuranceDataLoader(data_dir)
+            loader.load_data()
+            assert loader._load_cached_profile() is None, "Empty cache should miss"
+            first = loader.profile_data()
+            assert os.path.exists(cache_path), "Profile should be written to the cache"
+            
+            loader = InsuranceDataLoader(data_dir)
+            loader.load_data()
+            assert loader._load_cached_profile() is not None, "Unchanged files should hit"
+            assert loader.profile_data() == first, "Cached profile should match the computed one"
+            print("✓ Unchanged data files reuse the cached profile")
+            
+            parquet_file = os.path.join(data_dir, sorted(os.listdir(data_dir))[0])
+            st = os.stat(parquet_file)
+            os.utime(parquet_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+            loader = InsuranceDataLoader(data_dir)
+            loader.load_data()
+            assert loader._load_cached_profile() is None, "Modified file should miss"
+            print("✓ Modified data file invalidates the cache")
+    
+    print("\n✅ Profile Cache Test PASSED")
+    return True
+
+
+def test_pql_cache():
+    """Test the opt-in PQL translation cache and its schema key (no API calls)."""
+    print("\n" + "="*80)
+    print("TEST 8: PQL Translation Cache")
+    print("="*80)
+    
+    import os
+    import tempfile
+    from unittest import mock
+    from src.kumo_setup import _freeze
+    from src.text_to_pql import TextToPQLTranslator
+    
+    schema = {
+        "tables": {
+            "claims": {
+                "name": "claims",
+                "primary_key": "claim_id",
+                "columns": {"claim_id": {"stype": "ID"}}
+            }
+        },
+        "relationships": []
+    }
+    question = "Is claim 123 fraudulent?"
+    result = {"pql_query": "PREDICT claims.fraud_flag FOR claims.claim_id=123", "confidence": 0.9}
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache_path = os.path.join(tmp_dir, "pql_cache.json")
+        # The client is created but never called
+        with mock.patch.dict(os.environ, {"OPENAI_API_KEY": "sk-test", "PQL_CACHE_PATH": ""}):
+            assert TextToPQLTranslator(schema).cache_path is None, "Cache should be off by default"
+            print("✓ Cache disabled by default")
+            
+            translator = TextToPQLTranslator(schema, cache_path=cache_path)
+            assert translator.cached_translation(question) is None, "Empty cache should miss"
+            translator._store_translation(translator._cache_key(question), result)
+            assert translator.cached_translation(question) == result, "Stored translation should hit"
+            
+            translator = TextToPQLTranslator(schema, cache_path=cache_path)
+            assert translator.cached_translation(question) == result, "Cache should persist across instances"
+            print("✓ Stored translation is served from the cache file")
+            
+            translator.graph_schema = _freeze(schema)
+            assert translator.cached_translation(question) == result, "Frozen schema should hash the same"
+            print("✓ Frozen schema hashes like the plain one")
+            
+            changed = dict(schema, relationships=[
+                {"src_table": "claims", "fkey": "customer_id", "dst_table": "customers"}
+            ])
+            translator.graph_schema = changed
+            assert translator.cached_translation(question) is None, "Schema change should miss"
+            print("✓ Schema change invalidates cached translations")
+    
+    print("\n✅ PQL Cache Test PASSED")
+    return True
+
+
+def test_fk_overlap():
+    """Test foreign key detection by value overlap."""
+    print("\n" + "="*80)
+    print("TEST 9: Foreign Keys by Value Overlap")
+    print("="*80)
+    
+    import tempfile
+    import pandas as pd
+    from src.excel_converter import ExcelToParquetConverter
+    
+    policies = pd.DataFrame({
+        "policy_ID": ["P001", "P002", "P003"],
+        "premium": [100.0, 200.0, 300.0]
+    })
+    
+    def analyze(policy_numbers):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            converter = ExcelToParquetConverter(output_dir=tmp_dir, verbose=False)
+            converter.tables = {
+                "claims": pd.DataFrame({
+                    "claim_ID": [1, 2, 3, 4],
+                    "policy_number": policy_numbers
+                }),
+                "policies": policies
+            }
+            return converter.analyze_schema(), converter.infer_relationships()
+    
+    schema_info, relationships = analyze(["P001", "P002", "P002", "P003"])
+    assert schema_info["claims"]["primary_key"] == "claim_ID"
+    assert "policy_number" in schema_info["claims"]["foreign_keys"], "Overlapping keys should match"
+    assert relationships == [{
+        "src_table": "claims",
+        "fkey": "policy_number",
+        "dst_table": "policies",
+        "dst_key": "policy_ID"
+    }]
+    print("✓ claims.policy_number → policies.policy_ID detected by value overlap")
+    
+    schema_info, relationships = analyze(["X001", "X002", "X002", "P003"])
+    assert "policy_number" not in schema_info["claims"]["foreign_keys"], "Disjoint keys should not match"
+    assert relationships == []
+    print("✓ Column with too little overlap is not a foreign key")
+    
+    print("\n✅ FK Overlap Test PASSED")
+    return True
+
+
 def main():
     """Run all tests."""
     print("="*80)
@@ -127,7 +350,11 @@ def main():
         test_kumo_setup,
         test_text_to_pql,
         test_kumo_agent,
-        test_main_module
+        test_main_module,
+        test_semantic_cache,
+        test_profile_cache,
+        test_pql_cache,
+        test_fk_overlap
     ]
     
     results = []